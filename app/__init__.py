@@ -7,13 +7,14 @@ from flask_jwt_extended import JWTManager
 from app.celery import celery_init_app
 from app.cli import register_commands
 from app.exceptions.handler import register_error_handlers
-from app.extension import db, limiter, ma, mail, migrate
+from app.extension import db, limiter, ma, mail, migrate, redis_client
 from config.celery import CeleryConfig
 from config.cors import CORS_CONFIG
 from config.database import DatabaseConfig
 from config.jwt import JWTConfig
 from config.logging import logger, setup_logging
 from config.mail import MailConfig
+from config.redis import RedisConfig
 
 app = Flask(__name__, template_folder="../templates")
 
@@ -29,6 +30,7 @@ app.config.from_object(DatabaseConfig)
 app.config.from_object(JWTConfig)
 app.config.from_object(CeleryConfig)
 app.config.from_object(MailConfig)
+app.config.from_object(RedisConfig)
 
 # /////// Initialize extensions ////////////
 db.init_app(app)
@@ -37,6 +39,7 @@ limiter.init_app(app)
 ma.init_app(app)
 celery_app = celery_init_app(app)
 mail.init_app(app)
+app.extensions["redis"] = redis_client
 # JWT
 jwt = JWTManager(app)
 
@@ -1,6 +1,8 @@
 from celery import Celery
+from celery.signals import worker_process_init
 from flask import Flask
 
+from app.extension import db
 from config.celery import CeleryConfig
 
 celery = Celery(__name__)
@@ -11,5 +13,12 @@ def celery_init_app(app: Flask):
     celery.conf.result_backend = CeleryConfig.CELERY_RESULT_BACKEND
     celery.conf.task_ignore_result = CeleryConfig.CELERY_TASK_IGNORE_RESULT
 
+    @worker_process_init.connect(weak=False)
+    def reset_db_pool(**kwargs):
+        """Drop pooled connections inherited from the parent after fork."""
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
     celery.set_default()
     return celery
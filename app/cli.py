@@ -9,3 +9,63 @@ def register_commands(app):
     def seed():
         run()
         click.echo("Database seeded successfully")
+
+    @app.cli.command("db:explain")
+    def explain():
+        """Check with EXPLAIN that every hot DAO query uses an index (MySQL)."""
+        from app.extension import db
+        from app.utils.explain import run as run_explain
+
+        if db.engine.dialect.name != "mysql":
+            raise click.ClickException("db:explain requires a MySQL database")
+
+        failed = 0
+        for name, plan, uses_index in run_explain():
+            failed += not uses_index
+            click.echo(f"{'OK  ' if uses_index else 'SCAN'} {name}")
+            for row in plan:
+                click.echo(
+                    f"     table={row['table']} type={row['type']} "
+                    f"key={row['key']} rows={row['rows']}"
+                )
+
+        if failed:
+            raise click.ClickException(f"{failed} queries do not use an index")
+        click.echo("All queries use an index")
+
+    @app.cli.command("csv:benchmark")
+    @click.option("--rows", default=100000, help="Synthetic rows to export.")
+    @click.option("--chunk-size", default=None, type=int, help="Chunk size in bytes.")
+    @click.option("--db", "from_db", is_flag=True, help="Export the posts table.")
+    def csv_benchmark(rows, chunk_size, from_db):
+        """Measure rows/sec and peak RSS of the post CSV export path."""
+        from app.dao.post_dao import PostDao
+        from app.utils import benchmark
+        from app.utils.csv import CSV
+
+        posts = (
+            PostDao.stream_all_posts([], {})
+            if from_db
+            else benchmark.synthetic_posts(rows)
+        )
+        options = {"chunk_size": chunk_size} if chunk_size else {}
+        result = benchmark.csv_export(posts, CSV.post_csv_generator, **options)
+        for key, value in result.items():
+            click.echo(f"{key:>20}: {value}")
+
+    @app.cli.command("jwt:benchmark")
+    @click.option("--requests", default=10000, help="Simulated requests.")
+    @click.option("--calls", default=3, help="Identity reads per request.")
+    def jwt_benchmark(requests, calls):
+        """Compare per-call JWT verification with the request-scoped identity."""
+        from flask_jwt_extended import create_access_token
+
+        from app.utils import benchmark
+
+        token = create_access_token(
+            identity="1", additional_claims={"user": {"id": 1, "role": 0}}
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        result = benchmark.jwt_verification(app, headers, requests, calls)
+        for key, value in result.items():
+            click.echo(f"{key:>24}: {value}")
@@ -85,7 +85,9 @@ def refresh():
             return {"msg": "Refresh token invalid."}, 403
         if not user:
             return {"msg": "Invalid identity."}, 403
-        revoke_refresh_token(old_refresh_token)
+        if not revoke_refresh_token(old_refresh_token):
+            db.session.rollback()
+            return {"msg": "Refresh token invalid."}, 403
         new_access_token = create_access_token(
             identity=str(user_id), additional_claims={"user": user_data}
         )
@@ -0,0 +1,15 @@
+from flask import jsonify
+
+from app.extension import redis_client as r
+from app.utils.progress import ProgressReporter
+
+
+def bulk_progress(task_id):
+    """Get select-all bulk action progress from redis"""
+    return jsonify(ProgressReporter(r, task_id, prefix="bulk").read())
+
+
+def cancel_bulk(task_id):
+    """Cancel a select-all bulk action, it stops before its next chunk"""
+    ProgressReporter(r, task_id, prefix="bulk").cancel()
+    return jsonify({"msg": "Cancel requested", "task_id": task_id}), 202
@@ -0,0 +1,11 @@
+from flask import jsonify
+
+from app.extension import db
+from app.utils.db_pool import pool_stats
+
+
+def db_pool_stats():
+    """Connection pool usage of every engine of this process"""
+    return jsonify(
+        {bind or "default": pool_stats(engine) for bind, engine in db.engines.items()}
+    )
@@ -2,40 +2,62 @@ import json
 import os
 import tempfile
 
-import redis
 from flask import Response, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity
 from werkzeug.exceptions import HTTPException
 
+from app.enum.import_job import ImportJobStatus
 from app.extension import db
+from app.extension import redis_client as r
 from app.request.post_request import CreatePostRequest, UpdatePostRequest
 from app.schema.post_schema import PostSchema
 from app.service.post_service import PostService
 from app.shared.commons import (
+    CSV_IMPORT_MAX_SHARDS,
+    CSV_IMPORT_MAX_SIZE,
+    cursor_paginate_response,
     paginate_response,
     raise_error,
     response_valid_request,
     validate_request,
 )
-from app.task.import_posts import import_posts_from_csv
+from app.utils.csv import CSV, CSV_EXPORT_FORMATS
 from app.utils.log import log_handler
-from app.utils.request import request_query
-from config.celery import CeleryConfig
+from app.utils.progress import ProgressReporter
+from app.utils.request import request_count_mode, request_query
 from config.logging import logger
 
 posts_schema = PostSchema(many=True)
 post_schema = PostSchema()
-r = redis.Redis.from_url(f"{CeleryConfig.REDIS_URL}/1")
 
 
 def post_list():
-    """Return a paginated list of posts with optional filters."""
+    """Return a paginated list of posts with optional filters.
+
+    Passing `cursor` (empty for the first page) switches to keyset pagination,
+    which skips the total count and returns next/prev cursors instead of pages.
+    `count` (cached|estimate|exact|none) controls how the page total is resolved.
+    `sort=relevance` orders by full-text score when SEARCH_BACKEND is fulltext.
+    """
     filters = request_query(
-        {"name": str, "description": str, "status": int, "date": str}
+        {
+            "name": str,
+            "description": str,
+            "status": int,
+            "date": str,
+            "date_from": str,
+            "date_to": str,
+            "sort": str,
+        }
     )
-    page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
-    posts = PostService.filter_paginate(filters, page, per_page)
+    cursor = request.args.get("cursor", type=str)
+    if cursor is not None:
+        posts = PostService.filter_cursor_paginate(filters, cursor, per_page)
+        return cursor_paginate_response(posts, posts_schema)
+    page = request.args.get("page", 1, type=int)
+    count = request_count_mode()
+    posts = PostService.filter_paginate(filters, page, per_page, count)
     return paginate_response(posts, posts_schema)
 
 
@@ -90,6 +112,10 @@ def delete_posts():
     if not payload:
         return jsonify({"msg": "empty data"}), 400
     try:
+        # select-all in the background when asked to
+        if payload.get("all") and payload.get("async"):
+            task_id = PostService.start_bulk_action("delete_posts", payload)
+            return jsonify({"msg": "Delete started", "task_id": task_id}), 202
         posts = PostService.delete_posts(payload)
         db.session.commit()
         return jsonify({"msg": f"{posts} posts deleted successfully"}), 200
@@ -103,15 +129,35 @@ def delete_posts():
 
 
 def stream_csv_export():
-    """Export CSV"""
+    """
+    Export CSV
+    `format` (csv|gzip|zstd) returns a compressed file, plain csv is gzip
+    encoded on the fly when the client sends `Accept-Encoding: gzip`.
+    """
     try:
         payload = request.get_json(silent=True) or {}
+        export_format = payload.get("format") or request.args.get("format", "csv")
+        if export_format not in CSV_EXPORT_FORMATS:
+            return (
+                jsonify(
+                    {"msg": f"The format must be {', '.join(CSV_EXPORT_FORMATS)}."}
+                ),
+                400,
+            )
+        mimetype, extension = CSV_EXPORT_FORMATS[export_format]
+        headers = {"Content-Disposition": f"attachment; filename=posts.{extension}"}
         generator = PostService.export_posts_csv(payload)
+        if export_format != "csv":
+            generator = CSV.compress(generator, export_format)
+        elif request.accept_encodings.quality("gzip"):
+            generator = CSV.compress(generator, "gzip")
+            headers["Content-Encoding"] = "gzip"
+            headers["Vary"] = "Accept-Encoding"
 
         return Response(
             stream_with_context(generator),
-            mimetype="text/csv",
-            headers={"Content-Disposition": "attachment; filename=posts.csv"},
+            mimetype=mimetype,
+            headers=headers,
         )
     except Exception as e:
         log_handler("error", "Post Controller : stream_csv_export =>", e)
@@ -123,37 +169,63 @@ def import_csv():
     try:
         user_id = get_jwt_identity()
         file = request.files.get("file")
-        MAX_FILE_SIZE = 2 * 1024 * 1024  # 2 MB
         if not file:
             return jsonify({"msg": "CSV file required"}), 400
         filename = file.filename
         ext = os.path.splitext(filename)[1].lower()
         if ext != ".csv":
             return jsonify({"msg": "The CSV File field is required"}), 400
-        # Check file size (2MB)
+        # Check file size (CSV_IMPORT_MAX_SIZE)
         file.seek(0, os.SEEK_END)
         file_size = file.tell()
         file.seek(0)
-        if file_size > MAX_FILE_SIZE:
-            return jsonify({"msg": "The CSV File size must be greater than 2MB."}), 400
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
-        file.save(tmp.name)
-        task = import_posts_from_csv.delay(tmp.name, user_id)
-        return jsonify({"msg": "Import started", "task_id": task.id}), 200
+        if file_size > CSV_IMPORT_MAX_SIZE:
+            max_mb = CSV_IMPORT_MAX_SIZE // (1024 * 1024)
+            return (
+                jsonify(
+                    {"msg": f"The CSV File size must not be greater than {max_mb}MB."}
+                ),
+                400,
+            )
+        # the task removes the file when the job finishes
+        fd, file_path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        file_hash = CSV.save_upload(file, file_path)
+        # Split large imports across workers when `shards` > 1
+        shards = min(
+            max(request.form.get("shards", 1, type=int), 1), CSV_IMPORT_MAX_SHARDS
+        )
+        job, started = PostService.start_import(file_path, user_id, file_hash, shards)
+        status = ImportJobStatus(job.status).name
+        if started:
+            msg = "Import started"
+        elif status == ImportJobStatus.SUCCESS.name:
+            msg = "Import already finished"
+        else:
+            msg = "Import already started"
+        return jsonify({"msg": msg, "task_id": job.task_id, "status": status}), 200
     except Exception as e:
         log_handler("error", "Post Controller :  import csv =>", e)
         return jsonify({"msg": str(e)}), 500
 
 
 def csv_progress(task_id):
-    """Get CSV upload progress from redis"""
-    progress = r.get(f"csv_progress:{task_id}")
-    status = r.get(f"csv_status:{task_id}")
-    errors = r.get(f"csv_errors:{task_id}")
-    response = {
-        "progress": int(progress) if progress else 0,
-        "status": status.decode() if status else "PENDING",
-    }
-    if response["status"] == "FAILURE":
-        response["errors"] = json.loads(errors.decode()) if errors else []
-    return jsonify(response)
+    """Get CSV upload progress, rows/sec and ETA (seconds) from redis"""
+    return jsonify(ProgressReporter(r, task_id).read())
+
+
+def csv_progress_stream(task_id):
+    """Stream CSV upload progress as server-sent events until it finishes"""
+
+    def generate():
+        for state in ProgressReporter(r, task_id).events():
+            if state is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(state)}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -21,6 +21,7 @@ from app.shared.commons import (
     validate_request,
 )
 from app.utils.log import log_handler
+from app.utils.request import request_count_mode
 from config.logging import logger
 
 user_schema = UserSchema()
@@ -34,6 +35,7 @@ UPLOAD_DIR = "public/images/profile"
 
 def get_users():
     """Return a paginated list of users with optional filters."""
+    count = request_count_mode()
     try:
         filters = {
             "name": request.args.get("name", type=str),
@@ -45,7 +47,7 @@ def get_users():
 
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 10, type=int)
-        pagination = UserService.filter_paginate(filters, page, per_page)
+        pagination = UserService.filter_paginate(filters, page, per_page, count)
 
         return paginate_response(pagination, user_list)
     except Exception as e:
@@ -82,7 +84,7 @@ def create_user(payload):
 
 def show_user(user_id):
     """Get User by user id"""
-    user = UserService.get_user(user_id)
+    user = UserService.get_user(user_id, replica=True)
     return jsonify(user_schema.dump(user)), 200
 
 
@@ -122,6 +124,10 @@ def delete_users():
     if not payload:
         return jsonify({"msg": "empty data"}), 400
     try:
+        # select-all in the background when asked to
+        if payload.get("all") and payload.get("async"):
+            task_id = UserService.start_bulk_action("delete_users", payload)
+            return jsonify({"msg": "Delete started", "task_id": task_id}), 202
         deleted_user_count = UserService.delete_users(payload)
         db.session.commit()
         return jsonify({"msg": f"{deleted_user_count} users deleted successfully"}), 200
@@ -140,6 +146,10 @@ def lock_users():
     if not payload:
         return jsonify({"msg": "empty data"}), 400
     try:
+        # select-all in the background when asked to
+        if payload.get("all") and payload.get("async"):
+            task_id = UserService.start_bulk_action("lock_users", payload)
+            return jsonify({"msg": "Lock started", "task_id": task_id}), 202
         users = UserService.lock_users(payload)
         db.session.commit()
         return jsonify({"msg": f"{users} users locked successfully"}), 200
@@ -158,6 +168,10 @@ def unlock_users():
     if not payload:
         return jsonify({"msg": "empty data"}), 400
     try:
+        # select-all in the background when asked to
+        if payload.get("all") and payload.get("async"):
+            task_id = UserService.start_bulk_action("unlock_users", payload)
+            return jsonify({"msg": "Unlock started", "task_id": task_id}), 202
         users = UserService.unlock_users(payload)
         db.session.commit()
         return jsonify({"msg": f"{users} users unlocked successfully"}), 200
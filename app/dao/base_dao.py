@@ -5,4 +5,24 @@ from config.logging import logger
 
 @static_all_methods
 class BaseDao:
-    pass
+
+    def chunk_ids(query, model, size: int):
+        """
+        Yield the primary keys matched by `query` in ascending chunks of
+        `size`, each chunk read with a keyset (id > last id) query so rows
+        updated by earlier chunks are never rescanned.
+        """
+        last_id = 0
+        while True:
+            ids = [
+                row.id
+                for row in query.filter(model.id > last_id)
+                .order_by(None)
+                .order_by(model.id)
+                .with_entities(model.id)
+                .limit(size)
+            ]
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
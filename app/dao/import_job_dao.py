@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from app.dao.base_dao import BaseDao
+from app.enum.import_job import ImportJobStatus
+from app.extension import db
+from app.models.import_job import ImportJob
+from app.models.user import User
+from app.shared.commons import CSV_IMPORT_TIME_LIMIT
+
+UNFINISHED_STATUSES = [ImportJobStatus.PENDING.value, ImportJobStatus.RUNNING.value]
+
+
+class ImportJobDao(BaseDao):
+
+    def create_job(task_id: str, user_id: int, file_hash: str | None = None):
+        """Insert a pending import job"""
+        job = ImportJob(task_id=task_id, user_id=user_id, file_hash=file_hash)
+        db.session.add(job)
+        return job
+
+    def find_by_task_id(task_id: str):
+        """Get the job of a task"""
+        return ImportJob.query.filter_by(task_id=task_id).first()
+
+    def lock_uploads(user_id: int):
+        """
+        Lock the user row until commit, so concurrent uploads of one user
+        check and create their jobs one at a time.
+        """
+        User.query.filter_by(id=user_id).with_for_update().first()
+
+    def fail_stale(user_id: int, file_hash: str):
+        """
+        Mark the pending / running jobs of the same upload not touched for
+        CSV_IMPORT_TIME_LIMIT failed: their task was lost (enqueue failed,
+        worker died) and can no longer finish. A task still queued for one
+        of them sees the failed status and returns without importing.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=CSV_IMPORT_TIME_LIMIT)
+        ImportJob.query.filter_by(user_id=user_id, file_hash=file_hash).filter(
+            ImportJob.status.in_(UNFINISHED_STATUSES), ImportJob.updated_at < cutoff
+        ).update({"status": ImportJobStatus.FAILURE.value}, synchronize_session=False)
+
+    def find_active(user_id: int, file_hash: str):
+        """Get a pending, running or finished job of the same upload"""
+        return (
+            ImportJob.query.filter_by(user_id=user_id, file_hash=file_hash)
+            .filter(
+                ImportJob.status.in_(
+                    [*UNFINISHED_STATUSES, ImportJobStatus.SUCCESS.value]
+                )
+            )
+            .first()
+        )
+
+    def set_status(job: ImportJob, status: ImportJobStatus):
+        """Change the job status"""
+        job.status = status.value
+
+    def checkpoint(job: ImportJob, row: int, offset: int = 0):
+        """Record the last committed row, commit it with the rows it covers"""
+        job.last_row = row
+        job.last_offset = offset
+
+    def touch(job: ImportJob):
+        """Mark the job alive, e.g. while its shards make progress"""
+        job.updated_at = datetime.utcnow()
@@ -1,6 +1,7 @@
 from datetime import datetime
 from itertools import batched
 
+from sqlalchemy import insert
 from sqlalchemy.orm import joinedload
 
 from app.dao.base_dao import BaseDao
@@ -9,22 +10,104 @@ from app.extension import db
 from app.models.post import Post
 from app.models.scopes.post_scopes import PostScopes
 from app.shared.commons import BATCH_SIZE
-from app.utils.jwt import auth_user
+from app.utils.count_cache import CountCache
+from app.utils.cursor import encode_cursor
+from app.utils.jwt import current_identity
 from app.utils.request import clean_filters
 from config.logging import logger
 
+# Columns exported to CSV, in CSV header order
+EXPORT_COLUMNS = (
+    Post.id,
+    Post.title,
+    Post.description,
+    Post.status,
+    Post.create_user_id,
+    Post.updated_user_id,
+    Post.deleted_user_id,
+    Post.deleted_at,
+    Post.created_at,
+    Post.updated_at,
+)
+
 
 class PostDao(BaseDao):
 
-    def paginate(filters, page: int, per_page: int):
+    def paginate(filters, page: int, per_page: int, count: str = "cached"):
         """
-        Return filtered and paginated posts.
+        Return filtered and paginated posts, read from the replica.
+        The total is resolved through CountCache according to the count mode.
         """
+        owner_id = PostDao.owner_id()
         query = Post.query
-        if int(auth_user()["role"]) == UserRole.USER.value:
-            query = query.filter_by(create_user_id=auth_user()["id"])
+        if owner_id:
+            query = query.filter_by(create_user_id=owner_id)
         query = PostDao.filters_query(query, filters)
-        return query.paginate(page=page, per_page=per_page, error_out=False)
+        with db.replica():
+            pagination = PostScopes.with_users(query).paginate(
+                page=page, per_page=per_page, error_out=False, count=False
+            )
+            pagination.total = CountCache.total(
+                "posts", {**filters, "owner_id": owner_id}, query, count
+            )
+        return pagination
+
+    def cursor_paginate(filters, cursor: dict | None, per_page: int):
+        """
+        Return filtered posts using keyset pagination on Post.id DESC, read
+        from the replica. No count query is issued; one extra row is fetched to detect more pages.
+        """
+        cursor = cursor or {}
+        last_id = cursor.get("id")
+        backward = cursor.get("dir") == "prev"
+        query = PostDao.owner_query(Post.query)
+        query = PostDao.filters_query(query, filters, latest=False)
+        if backward:
+            if last_id is not None:
+                query = query.filter(Post.id > last_id)
+            query = query.order_by(Post.id.asc())
+        else:
+            if last_id is not None:
+                query = query.filter(Post.id < last_id)
+            query = PostScopes.latest(query)
+
+        with db.replica():
+            posts = PostScopes.with_users(query).limit(per_page + 1).all()
+        has_more = len(posts) > per_page
+        posts = posts[:per_page]
+        if backward:
+            posts.reverse()
+        has_next = (last_id is not None) if backward else has_more
+        has_prev = has_more if backward else (last_id is not None)
+
+        return {
+            "items": posts,
+            "per_page": per_page,
+            "next_cursor": (
+                encode_cursor({"id": posts[-1].id, "dir": "next"})
+                if posts and has_next
+                else None
+            ),
+            "prev_cursor": (
+                encode_cursor({"id": posts[0].id, "dir": "prev"})
+                if posts and has_prev
+                else None
+            ),
+        }
+
+    def owner_query(query):
+        """Restrict normal users to their own posts."""
+        owner_id = PostDao.owner_id()
+        if owner_id:
+            query = query.filter_by(create_user_id=owner_id)
+        return query
+
+    def owner_id():
+        """Return the auth user id when the user may only see own posts."""
+        identity = current_identity()
+        if identity.role == UserRole.USER.value:
+            return identity.user["id"]
+        return None
 
     def create(post: Post):
         """Add post to session"""
@@ -32,28 +115,33 @@ class PostDao(BaseDao):
         return post
 
     def get_post(post_id: int):
-        """Get Post using post id"""
-        post = (
-            Post.query.options(joinedload(Post.creator), joinedload(Post.updater))
-            .filter_by(id=post_id, deleted_at=None)
-            .first()
-        )
+        """Get Post using post id, read from the replica"""
+        with db.replica():
+            post = (
+                Post.query.options(joinedload(Post.creator), joinedload(Post.updater))
+                .filter_by(id=post_id, deleted_at=None)
+                .first()
+            )
         return post
 
-    def delete_posts(post_ids: list[int]):
-        """Soft delete posts by post ids in batches"""
+    def delete_posts(post_ids: list[int], deleted_user_id: int):
+        """
+        Soft delete posts by post ids with one UPDATE per BATCH_SIZE ids.
+        Returns the number of posts actually deleted.
+        """
+        deleted_at = datetime.utcnow()
         deleted_count = 0
-        for batch in batched(post_ids, BATCH_SIZE):
-            posts = Post.query.filter(
+        for batch in batched(sorted(set(post_ids)), BATCH_SIZE):
+            deleted_count += Post.query.filter(
                 Post.id.in_(batch), Post.deleted_at.is_(None)
-            ).all()
-            for post in posts:
-                post.soft_delete()
-                deleted_count += 1
+            ).update(
+                {"deleted_at": deleted_at, "deleted_user_id": deleted_user_id},
+                synchronize_session=False,
+            )
         return deleted_count
 
-    def delete_all_posts(exclude_ids: list[int], filters):
-        """Delete all posts or all except exclude_ids."""
+    def all_posts_query(exclude_ids: list[int], filters):
+        """Active posts of a select-all action, all except exclude_ids."""
         query = Post.query
         query = PostScopes.active(query)
         if exclude_ids:
@@ -61,8 +149,14 @@ class PostDao(BaseDao):
         if filters:
             filters = clean_filters(filters)
             query = PostDao.filters_query(query, filters, True, False)
+        return query
+
+    def delete_all_posts(exclude_ids: list[int], filters, deleted_user_id: int):
+        """Delete all posts or all except exclude_ids."""
+        query = PostDao.all_posts_query(exclude_ids, filters)
         deleted_count = query.update(
-            {"deleted_at": datetime.utcnow()}, synchronize_session=False
+            {"deleted_at": datetime.utcnow(), "deleted_user_id": deleted_user_id},
+            synchronize_session=False,
         )
         db.session.flush()
         return deleted_count
@@ -74,12 +168,29 @@ class PostDao(BaseDao):
             query = query.filter(Post.id != post_id)
         return query.first()
 
+    def bulk_insert(values: list[dict]):
+        """Insert many posts with a single executemany INSERT"""
+        db.session.execute(insert(Post), values)
+
+    def get_existing_titles(titles: list[str]) -> set[str]:
+        """Return the lower-cased titles that already exist, in one IN query"""
+        if not titles:
+            return set()
+        query = Post.query.with_entities(Post.title).filter(Post.title.in_(set(titles)))
+        return {title.lower() for (title,) in query}
+
     def get_post_by_ids(post_ids: list[int]):
-        """Get posts by using post_ids"""
-        return Post.query.filter(Post.id.in_(post_ids)).all()
+        """Get posts by using post_ids, querying BATCH_SIZE ids at a time"""
+        posts = []
+        for batch in batched(sorted(set(post_ids)), BATCH_SIZE):
+            posts.extend(Post.query.filter(Post.id.in_(batch)).order_by(Post.id))
+        return posts
 
     def stream_all_posts(exclude_ids: list[int], filters):
-        """Stream all posts using batch loading."""
+        """
+        Stream all posts as export column tuples using a server-side cursor.
+        The query runs on the replica when the stream is consumed.
+        """
         query = Post.query
         if exclude_ids:
             query = query.filter(~Post.id.in_(exclude_ids))
@@ -90,12 +201,23 @@ class PostDao(BaseDao):
                 filters,
                 False,
             )
-        return query.yield_per(1000)
+        return (
+            query.with_entities(*EXPORT_COLUMNS)
+            .execution_options(replica=True)
+            .yield_per(1000)
+        )
 
     def stream_posts_by_ids(post_ids, all=False):
-        """Stream posts by a list of post IDs using batch loading."""
-        query = Post.query.filter(Post.id.in_(post_ids))
-        return query.yield_per(1000)
+        """
+        Stream posts by a list of post IDs as export column tuples.
+        IDs are exported in id order, BATCH_SIZE ids per IN-list query,
+        each run on the replica.
+        """
+        for batch in batched(sorted(set(post_ids)), BATCH_SIZE):
+            query = Post.query.filter(Post.id.in_(batch)).order_by(Post.id)
+            yield from query.with_entities(*EXPORT_COLUMNS).execution_options(
+                replica=True
+            )
 
     def find_one(include_deleted: bool = False, **filters):
         """To Search specific column"""
@@ -112,5 +234,5 @@ class PostDao(BaseDao):
         query = PostScopes.filter_status(query, filters)
         query = PostScopes.filter_date(query, filters)
         if latest:
-            query = PostScopes.latest(query)
+            query = PostScopes.sort(query, filters)
         return query
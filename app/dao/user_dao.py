@@ -1,7 +1,7 @@
+from contextlib import nullcontext
 from datetime import datetime
 from itertools import batched
 
-from flask_jwt_extended import get_jwt_identity
 from sqlalchemy import func, or_
 from sqlalchemy.orm import joinedload
 
@@ -10,6 +10,8 @@ from app.extension import db
 from app.models import User
 from app.models.scopes import UserScopes
 from app.shared.commons import BATCH_SIZE
+from app.utils.count_cache import CountCache
+from app.utils.jwt import current_identity
 from app.utils.request import clean_filters
 from config.logging import logger
 
@@ -30,67 +32,82 @@ class UserDao(BaseDao):
             email=email, deleted_at=None, lock_flg=False
         ).first()
 
-    def paginate(filters, page: int, per_page: int):
-        """Paginate User records with optional filters for name, email, role, and creation date."""
-        user_id = get_jwt_identity()
+    def paginate(filters, page: int, per_page: int, count: str = "cached"):
+        """Paginate User records with optional filters for name, email, role, and creation date, read from the replica."""
+        user_id = current_identity().id
         query = User.query
         query = UserScopes.active(query, exclude_user_id=user_id)
         query = UserScopes.filter_name_email(query, filters)
         query = UserScopes.filter_role(query, filters)
         query = UserScopes.filter_date(query, filters)
         query = UserScopes.latest(query)
+        with db.replica():
+            pagination = query.paginate(
+                page=page, per_page=per_page, error_out=False, count=False
+            )
+            pagination.total = CountCache.total(
+                "users", {**filters, "exclude_user_id": user_id}, query, count
+            )
 
-        return query.paginate(page=page, per_page=per_page, error_out=False)
+        return pagination
 
     def create(user: User):
         """Create User"""
         db.session.add(user)
         return user
 
-    def get_user(user_id: int):
-        """Get User with relationship"""
-        return (
-            User.query.options(joinedload(User.creator), joinedload(User.updater))
-            .filter_by(id=user_id, deleted_at=None, lock_flg=False)
-            .first()
-        )
-
-    def delete_users(user_ids: list[int]):
-        """Soft delete users by user ids in batches"""
+    def get_user(user_id: int, replica: bool = False):
+        """Get an active User with relationship, from the replica when `replica`"""
+        with db.replica() if replica else nullcontext():
+            return (
+                User.query.options(joinedload(User.creator), joinedload(User.updater))
+                .filter_by(id=user_id, deleted_at=None, lock_flg=False)
+                .first()
+            )
+
+    def delete_users(user_ids: list[int], deleted_user_id: int):
+        """
+        Soft delete users by user ids with one UPDATE per BATCH_SIZE ids.
+        Returns the number of users actually deleted.
+        """
+        deleted_at = datetime.utcnow()
         deleted_count = 0
-        for batch in batched(user_ids, BATCH_SIZE):
-            users = User.query.filter(
+        for batch in batched(sorted(set(user_ids)), BATCH_SIZE):
+            deleted_count += User.query.filter(
                 User.id.in_(batch), User.deleted_at.is_(None)
-            ).all()
-            for user in users:
-                user.soft_delete()
-                deleted_count += 1
+            ).update(
+                {"deleted_at": deleted_at, "deleted_user_id": deleted_user_id},
+                synchronize_session=False,
+            )
         return deleted_count
 
-    def delete_all_users(exclude_ids: list[int], filters):
-        """Delete all user or all except exclude_ids."""
-        user_id = get_jwt_identity()
-        query = User.query.filter(User.deleted_at.is_(None), User.id != user_id)
+    def all_users_query(exclude_ids: list[int], filters, exclude_user_id=None):
+        """Active users of a select-all action, all except exclude_ids."""
+        query = User.query.filter(User.deleted_at.is_(None))
+        if exclude_user_id:
+            query = query.filter(User.id != exclude_user_id)
         if exclude_ids:
             query = query.filter(~User.id.in_(exclude_ids))
         if filters:
             filters = clean_filters(filters)
             query = UserDao.filters_query(query, filters, True, False)
+        return query
+
+    def delete_all_users(exclude_ids: list[int], filters):
+        """Delete all user or all except exclude_ids."""
+        user_id = current_identity().id
+        query = UserDao.all_users_query(exclude_ids, filters, user_id)
         deleted_count = query.update(
-            {"deleted_at": datetime.utcnow()}, synchronize_session=False
+            {"deleted_at": datetime.utcnow(), "deleted_user_id": user_id},
+            synchronize_session=False,
         )
         db.session.flush()
         return deleted_count
 
     def lock_all_users(exclude_ids: list[int], filters):
         """Lock all users or all except exclude_ids."""
-        user_id = get_jwt_identity()
-        query = User.query.filter(User.deleted_at.is_(None), User.id != user_id)
-        if exclude_ids:
-            query = query.filter(~User.id.in_(exclude_ids))
-        if filters:
-            filters = clean_filters(filters)
-            query = UserDao.filters_query(query, filters, True, False)
+        user_id = current_identity().id
+        query = UserDao.all_users_query(exclude_ids, filters, user_id)
         lock_count = query.update(
             {
                 User.lock_flg: True,
@@ -104,24 +121,28 @@ class UserDao(BaseDao):
         return lock_count
 
     def lock_users(user_ids: list[int]):
-        """Lock multiple users by updating lock_flg, lock_count, last_lock_at"""
-        users = User.query.filter(
-            User.id.in_(user_ids), User.deleted_at.is_(None)
-        ).all()
-        for user in users:
-            user.lock_flg = True
-            user.lock_count = (user.lock_count or 0) + 1
-            user.last_lock_at = datetime.utcnow()
-        return users
+        """
+        Lock users by ids with one UPDATE per BATCH_SIZE ids, updating
+        lock_flg, lock_count and last_lock_at. Returns the number of users locked.
+        """
+        locked_at = datetime.utcnow()
+        lock_count = 0
+        for batch in batched(sorted(set(user_ids)), BATCH_SIZE):
+            lock_count += User.query.filter(
+                User.id.in_(batch), User.deleted_at.is_(None)
+            ).update(
+                {
+                    User.lock_flg: True,
+                    User.lock_count: func.coalesce(User.lock_count, 0) + 1,
+                    User.last_lock_at: locked_at,
+                },
+                synchronize_session=False,
+            )
+        return lock_count
 
     def unlock_all_users(exclude_ids: list[int], filters):
         """Lock all users or all except exclude_ids."""
-        query = User.query.filter(User.deleted_at.is_(None))
-        if exclude_ids:
-            query = query.filter(~User.id.in_(exclude_ids))
-        if filters:
-            filters = clean_filters(filters)
-            query = UserDao.filters_query(query, filters, True, False)
+        query = UserDao.all_users_query(exclude_ids, filters)
         lock_count = query.update(
             {
                 User.lock_flg: False,
@@ -134,14 +155,19 @@ class UserDao(BaseDao):
         return lock_count
 
     def unlock_users(user_ids: list[int]):
-        """UnLock multiple users by updating lock_flg, last_lock_at"""
-        users = User.query.filter(
-            User.id.in_(user_ids), User.deleted_at.is_(None)
-        ).all()
-        for user in users:
-            user.lock_flg = False
-            user.last_lock_at = None
-        return users
+        """
+        Unlock users by ids with one UPDATE per BATCH_SIZE ids, resetting
+        lock_flg and last_lock_at. Returns the number of users unlocked.
+        """
+        unlock_count = 0
+        for batch in batched(sorted(set(user_ids)), BATCH_SIZE):
+            unlock_count += User.query.filter(
+                User.id.in_(batch), User.deleted_at.is_(None)
+            ).update(
+                {User.lock_flg: False, User.last_lock_at: None},
+                synchronize_session=False,
+            )
+        return unlock_count
 
     def filters_query(query, filters, active=True, latest=True, current_user_id=None):
         """Filter Query"""
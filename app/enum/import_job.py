@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ImportJobStatus(Enum):
+    PENDING = 0
+    RUNNING = 1
+    SUCCESS = 2
+    FAILURE = 3
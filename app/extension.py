@@ -10,6 +10,8 @@ Extensions:
     - ma (Marshmallow): Handles object serialization and deserialization.
     - limiter (Limiter): Implements rate limiting on routes, using the client IP
       as the key function.
+    - redis_client (Redis): Shared client on one connection pool, reused by
+      controllers, tasks, caches and the limiter storage.
 
 Usage:
     from app.extension import db, migrate, ma, limiter
@@ -23,6 +25,7 @@ Usage:
         return app
 """
 
+import redis
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_mail import Mail
@@ -30,17 +33,34 @@ from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
-from app.shared.database import softDelete, timeStamp
-from config.celery import CeleryConfig
+from app.shared.database import RoutingSession, replica, softDelete, timeStamp
+from app.utils.db_pool import TimedQueuePool
+from config.redis import RedisConfig
 
 # Initialize Flask extensions
-db = SQLAlchemy()
+# pool size / timeouts come from SQLALCHEMY_ENGINE_OPTIONS
+db = SQLAlchemy(
+    engine_options={"poolclass": TimedQueuePool},
+    session_options={"class_": RoutingSession},
+)
 migrate = Migrate()
 ma = Marshmallow()
+# Connections are opened lazily and the pool is reset after a fork
+redis_pool = redis.ConnectionPool.from_url(
+    RedisConfig.REDIS_CACHE_URL,
+    max_connections=RedisConfig.REDIS_MAX_CONNECTIONS,
+    socket_timeout=RedisConfig.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=RedisConfig.REDIS_SOCKET_CONNECT_TIMEOUT,
+    health_check_interval=RedisConfig.REDIS_HEALTH_CHECK_INTERVAL,
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
 limiter = Limiter(
-    key_func=get_remote_address, storage_uri=f"{CeleryConfig.REDIS_URL}/1"
+    key_func=get_remote_address,
+    storage_uri=RedisConfig.REDIS_CACHE_URL,
+    storage_options={"connection_pool": redis_pool},
 )
 mail = Mail()
 
 db.timeStamp = timeStamp
 db.softDelete = softDelete
+db.replica = replica
@@ -1,5 +1,6 @@
 from flask import request
-from flask_jwt_extended import verify_jwt_in_request
+
+from app.utils.jwt import current_identity
 
 CONDITIONAL_JWT_ROUTES = [
     "/api/posts",
@@ -22,9 +23,9 @@ def post_middleware():
 
     # Skip routes that don't need JWT at all
     if path not in CONDITIONAL_JWT_ROUTES:
-        verify_jwt_in_request()
+        current_identity()
         return
     # If any filter param is provided, require JWT
-    filter_params = ["name", "description", "status", "date"]
+    filter_params = ["name", "description", "status", "date", "date_from", "date_to"]
     if any(request.args.get(param) is not None for param in filter_params):
-        verify_jwt_in_request()
+        current_identity()
@@ -1,17 +1,16 @@
 from flask import jsonify, request
-from flask_jwt_extended import jwt_required
+
+from app.utils.jwt import current_identity
 
 
-@jwt_required()
 def user_middleware():
     """
-    Placeholder middleware function for user-related request processing.
+    Require a valid JWT for user routes.
 
-    This function is intended to be used as a middleware hook (before or
-    after a request) in a Flask application. Currently, it does not perform
-    any actions.
+    The identity is verified here once and cached for the request, DAOs and
+    services read it through `current_identity()`.
 
     Returns:
         None
     """
-    pass
+    current_identity()
@@ -7,9 +7,10 @@ Usage:
     from app.models import User, Post,etc..
 """
 
+from .import_job import ImportJob
 from .password_reset import PasswordReset
 from .post import Post
 from .refresh_token import RefreshToken
 from .user import User
 
-__all__ = ["User", "Post", "PasswordReset", "RefreshToken"]
+__all__ = ["User", "Post", "PasswordReset", "RefreshToken", "ImportJob"]
@@ -0,0 +1,29 @@
+from app.enum.import_job import ImportJobStatus
+from app.extension import db
+
+
+class ImportJob(db.Model):
+    """
+    _Import Job Table_
+    """
+
+    __tablename__ = "import_jobs"
+
+    id = db.Column(db.BigInteger, primary_key=True, nullable=False, autoincrement=True)
+    task_id = db.Column(db.String(255), nullable=False, unique=True)
+    user_id = db.Column(db.BigInteger, db.ForeignKey("users.id"), nullable=False)
+    file_hash = db.Column(db.String(64))
+    status = db.Column(
+        db.Integer, nullable=False, default=ImportJobStatus.PENDING.value
+    )
+    # last CSV row committed, a retried task resumes after it
+    last_row = db.Column(db.BigInteger, nullable=False, default=0)
+    # byte offset after the last committed row, a retried shard seeks to it
+    last_offset = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+# timestamp add
+db.timeStamp(ImportJob)
+
+# same upload lookup
+db.Index("ix_import_jobs_user_id_file_hash", ImportJob.user_id, ImportJob.file_hash)
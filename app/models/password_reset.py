@@ -16,3 +16,11 @@ class PasswordReset(db.Model):
 # timestamp add sof delete
 db.timeStamp(PasswordReset)
 db.softDelete(PasswordReset)
+
+# lookups by email / token of not deleted resets
+db.Index(
+    "ix_password_resets_email_deleted_at", PasswordReset.email, PasswordReset.deleted_at
+)
+db.Index(
+    "ix_password_resets_token_deleted_at", PasswordReset.token, PasswordReset.deleted_at
+)
@@ -1,3 +1,5 @@
+from sqlalchemy import DDL, event
+
 from app.extension import db
 
 
@@ -42,3 +44,42 @@ class Post(db.Model):
 # timestamp add sof delete
 db.timeStamp(Post)
 db.softDelete(Post)
+
+# active post listing ordered/filtered by id or created date
+db.Index("ix_posts_deleted_at_created_at", Post.deleted_at, Post.created_at)
+db.Index("ix_posts_deleted_at_id", Post.deleted_at, Post.id)
+db.Index(
+    "ix_posts_create_user_id_deleted_at_id",
+    Post.create_user_id,
+    Post.deleted_at,
+    Post.id,
+)
+
+# full-text search indexes (SEARCH_BACKEND=fulltext)
+db.Index("ft_posts_title", Post.title, mysql_prefix="FULLTEXT")
+db.Index("ft_posts_description", Post.description, mysql_prefix="FULLTEXT")
+
+# SQLite has no FULLTEXT, keep an FTS5 table in sync instead
+for statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+    "title, description, content='posts', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN "
+    "INSERT INTO posts_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO posts_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+):
+    event.listen(
+        Post.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Post.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS posts_fts").execute_if(dialect="sqlite"),
+)
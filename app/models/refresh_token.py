@@ -12,3 +12,7 @@ class RefreshToken(db.Model):
     revoked = db.Column(db.Boolean, default=False)
     expires_at = db.Column(db.DateTime, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# revoke all tokens of a user
+db.Index("ix_refresh_tokens_user_id", RefreshToken.user_id)
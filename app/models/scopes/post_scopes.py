@@ -1,11 +1,29 @@
-from datetime import datetime
+import re
+from datetime import datetime, time, timedelta
 
-from sqlalchemy import func, or_
+from flask import current_app
+from sqlalchemy import column, false, literal_column, or_, select, table
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import selectinload
 
+from app.extension import db
 from app.models.post import Post
 from app.utils.decorators import static_all_methods
 from config.logging import logger
 
+# SQLite FTS5 index kept in sync with posts (see app/models/post.py)
+posts_fts = table("posts_fts", column("rowid"))
+
+
+def search_words(term: str) -> list[str]:
+    """Split a search term into words without full-text operator characters."""
+    return re.sub(r'[+\-<>()~*"@:^]', " ", term).split()
+
+
+def day_start(value: str) -> datetime:
+    """Midnight of an ISO date (YYYY-MM-DD)."""
+    return datetime.combine(datetime.fromisoformat(value).date(), time.min)
+
 
 @static_all_methods
 class PostScopes:
@@ -23,6 +41,9 @@ class PostScopes:
         description = (filters.get("description") or "").strip()
 
         if title or description:
+            if current_app.config.get("SEARCH_BACKEND") == "fulltext":
+                return PostScopes.search_title_description(query, title, description)
+
             conditions = []
 
             if title:
@@ -35,6 +56,54 @@ class PostScopes:
 
         return query
 
+    def search_title_description(query, title, description):
+        """Filter posts by title and/or description using the full-text index."""
+        conditions = [
+            (
+                PostScopes.search_condition(column_name, term)
+                if search_words(term)
+                else false()
+            )
+            for column_name, term in (("title", title), ("description", description))
+            if term
+        ]
+        return query.filter(or_(*conditions))
+
+    def search_condition(column_name, term):
+        """MATCH ... AGAINST on MySQL, FTS5 MATCH on SQLite."""
+        words = search_words(term)
+        if db.engine.dialect.name == "mysql":
+            against = " ".join(f"+{word}*" for word in words)
+            return match(getattr(Post, column_name), against=against).in_boolean_mode()
+
+        phrases = " ".join(f'"{word}"*' for word in words)
+        return Post.id.in_(
+            select(posts_fts.c.rowid).where(
+                literal_column("posts_fts").op("MATCH")(f"{column_name} : ({phrases})")
+            )
+        )
+
+    def sort(query, filters):
+        """Order posts by full-text relevance when requested, otherwise latest."""
+        title = (filters.get("name") or "").strip()
+        description = (filters.get("description") or "").strip()
+        if (
+            filters.get("sort") == "relevance"
+            and current_app.config.get("SEARCH_BACKEND") == "fulltext"
+            and db.engine.dialect.name == "mysql"
+        ):
+            scores = [
+                match(getattr(Post, column_name), against=term)
+                for column_name, term in (
+                    ("title", title),
+                    ("description", description),
+                )
+                if search_words(term)
+            ]
+            if scores:
+                return query.order_by(sum(scores).desc(), Post.id.desc())
+        return PostScopes.latest(query)
+
     def filter_status(query, filters):
         """Filter posts by status."""
         status = filters.get("status")
@@ -43,18 +112,36 @@ class PostScopes:
         return query
 
     def filter_date(query, filters):
-        """Filter posts by created date (YYYY-MM-DD)."""
+        """
+        Filter posts by created date (YYYY-MM-DD) and/or a date_from/date_to range.
+        Days are matched as half-open ranges so an index on created_at can be used.
+        """
         date_str = filters.get("date")
+        date_from = filters.get("date_from")
+        date_to = filters.get("date_to")
 
         try:
             if date_str:
-                created_date = datetime.fromisoformat(date_str)
-                query = query.filter(func.date(Post.created_at) == created_date.date())
+                start = day_start(date_str)
+                query = query.filter(
+                    Post.created_at >= start,
+                    Post.created_at < start + timedelta(days=1),
+                )
+            if date_from:
+                query = query.filter(Post.created_at >= day_start(date_from))
+            if date_to:
+                query = query.filter(
+                    Post.created_at < day_start(date_to) + timedelta(days=1)
+                )
         except ValueError as e:
             logger.error(f"Invalid date format: {e}")
 
         return query
 
+    def with_users(query):
+        """Batch load creator and updater so a page costs a constant number of queries."""
+        return query.options(selectinload(Post.creator), selectinload(Post.updater))
+
     def latest(query):
         """Order posts by latest."""
         return query.order_by(Post.id.desc())
@@ -55,3 +55,9 @@ class User(db.Model):
 # timestamp add sof delete
 db.timeStamp(User)
 db.softDelete(User)
+
+# active user listing, role filter, date filter and lock checks
+db.Index("ix_users_deleted_at_id", User.deleted_at, User.id)
+db.Index("ix_users_deleted_at_role", User.deleted_at, User.role)
+db.Index("ix_users_deleted_at_created_at", User.deleted_at, User.created_at)
+db.Index("ix_users_deleted_at_lock_flg", User.deleted_at, User.lock_flg)
@@ -8,6 +8,7 @@ from app.dao.user_dao import UserDao
 from app.models.user import User
 from app.service.base_service import BaseService
 from app.shared.commons import field_error
+from app.utils.count_cache import CountCache
 from app.utils.hash import hash_password
 
 
@@ -26,6 +27,7 @@ class AuthService(BaseService):
             password=hash_password(payload.password),
         )
         user = UserDao.create(user)
+        CountCache.invalidate_on_commit("users")
 
         return {"user": user}
 
@@ -1,7 +1,19 @@
 # app/dao/base_service.py
+
+from app.task.bulk_actions import run_bulk_action
 from app.utils.decorators import static_all_methods
+from app.utils.jwt import current_identity
 
 
 @static_all_methods
 class BaseService:
-    pass
+
+    def start_bulk_action(action: str, payload):
+        """Queue a select-all action as a background task, return its task id."""
+        task = run_bulk_action.delay(
+            action,
+            current_identity().id,
+            payload.get("exclude_ids", []),
+            payload.get("filters", {}),
+        )
+        return task.id
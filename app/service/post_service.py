@@ -1,26 +1,48 @@
+from uuid import uuid4
+
 from flask import jsonify
-from flask_jwt_extended import get_jwt_identity
 
+from app.dao.import_job_dao import ImportJobDao
 from app.dao.post_dao import PostDao
+from app.enum.import_job import ImportJobStatus
 from app.extension import db
+from app.extension import redis_client as r
 from app.models.post import Post
 from app.service.base_service import BaseService
-from app.shared.commons import field_error, response_valid_request
+from app.shared.commons import field_error, raise_error, response_valid_request
+from app.task.import_posts import (
+    import_posts_from_csv,
+    import_posts_sharded,
+    remove_upload,
+)
+from app.utils.count_cache import CountCache
 from app.utils.csv import CSV
+from app.utils.cursor import decode_cursor
+from app.utils.jwt import current_identity
+from app.utils.progress import ProgressReporter
 from app.utils.request import clean_filters, request_query
 from config.logging import logger
 
 
 class PostService(BaseService):
 
-    def filter_paginate(filters, page: int, per_page: int):
+    def filter_paginate(filters, page: int, per_page: int, count: str = "cached"):
         """Filter posts and return paginated results."""
-        posts = PostDao.paginate(filters, page, per_page)
+        posts = PostDao.paginate(filters, page, per_page, count)
         return posts
 
+    def filter_cursor_paginate(filters, cursor: str, per_page: int):
+        """Filter posts and return a keyset (cursor) paginated page."""
+        position = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if not position or not isinstance(position.get("id"), int):
+                raise_error("cursor", "The cursor is invalid.", 400)
+        return PostDao.cursor_paginate(filters, position, per_page)
+
     def create_post(payload):
         """Create post."""
-        user_id = get_jwt_identity()
+        user_id = current_identity().id
         invalid_response = PostService.check_create_update_invalid_request(payload)
         if invalid_response:
             return invalid_response
@@ -32,6 +54,7 @@ class PostService(BaseService):
             updated_user_id=user_id,
         )
         post = PostDao.create(post)
+        CountCache.invalidate_on_commit("posts")
 
         return {"post": post}
 
@@ -45,7 +68,7 @@ class PostService(BaseService):
 
     def update_post(payload, id):
         """Update Post data"""
-        user_id = get_jwt_identity()
+        user_id = current_identity().id
         invalid_response = PostService.check_create_update_invalid_request(payload, id)
         if invalid_response:
             return invalid_response
@@ -54,21 +77,24 @@ class PostService(BaseService):
         post.description = payload.description
         post.status = payload.status
         post.updated_user_id = user_id
+        CountCache.invalidate_on_commit("posts")
 
         return {"post": post}
 
     def delete_posts(payload):
         """Delete posts by IDs."""
+        user_id = current_identity().id
         select_all = payload.get("all", False)
         post_ids = payload.get("post_ids", [])
         exclude_ids = payload.get("exclude_ids", [])
         if select_all:
             filters = payload.get("filters", {})
-            posts = PostDao.delete_all_posts(exclude_ids, filters)
+            posts = PostDao.delete_all_posts(exclude_ids, filters, user_id)
         else:
             if not isinstance(post_ids, list) or not post_ids:
                 raise ValueError("Provide post id list.")
-            posts = PostDao.delete_posts(post_ids)
+            posts = PostDao.delete_posts(post_ids, user_id)
+        CountCache.invalidate_on_commit("posts")
 
         return posts
 
@@ -90,6 +116,43 @@ class PostService(BaseService):
 
         return stream_posts
 
+    def start_import(file_path: str, user_id: int, file_hash: str, shards: int = 1):
+        """
+        Queue a CSV import under a new job record.
+        When the same user already queued or finished the same file, that job
+        is returned instead and nothing is queued. Returns (job, started).
+        """
+        # held until commit, two uploads of the same file cannot both start
+        ImportJobDao.lock_uploads(user_id)
+        ImportJobDao.fail_stale(user_id, file_hash)
+        job = ImportJobDao.find_active(user_id, file_hash)
+        if job:
+            db.session.commit()
+            remove_upload(file_path)
+            return job, False
+
+        job = ImportJobDao.create_job(str(uuid4()), user_id, file_hash)
+        # the job must exist before a worker can pick the task up
+        db.session.commit()
+        try:
+            # publish a first state, a progress stream ends on missing state
+            ProgressReporter(r, job.task_id).update(0.0, 0, force=True)
+            if shards > 1:
+                import_posts_sharded.apply_async(
+                    args=[file_path, user_id, shards], task_id=job.task_id
+                )
+            else:
+                import_posts_from_csv.apply_async(
+                    args=[file_path, user_id], task_id=job.task_id
+                )
+        except Exception:
+            # nothing will run the job, let the file be uploaded again
+            ImportJobDao.set_status(job, ImportJobStatus.FAILURE)
+            db.session.commit()
+            remove_upload(file_path)
+            raise
+        return job, True
+
     def check_create_update_invalid_request(payload, id=None):
         post = PostDao.get_by_title(payload.title, id)
         if post:
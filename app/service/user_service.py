@@ -1,28 +1,28 @@
-from flask_jwt_extended import get_jwt_identity
-
 from app.dao.user_dao import UserDao
 from app.models import User
 from app.service.base_service import BaseService
 from app.shared.commons import field_error, response_valid_request
+from app.utils.count_cache import CountCache
 from app.utils.hash import hash_password
+from app.utils.jwt import current_identity
 from config.logging import logger
 
 
 class UserService(BaseService):
     """Handles business logic"""
 
-    def filter_paginate(filters, page: int, per_page: int):
+    def filter_paginate(filters, page: int, per_page: int, count: str = "cached"):
         """
         User List with pagination
         """
-        users = UserDao.paginate(filters, page, per_page)
+        users = UserDao.paginate(filters, page, per_page, count)
         return users
 
-    def get_user(user_id):
+    def get_user(user_id, replica: bool = False):
         """
-        Get User by User ID
+        Get User by User ID, auth checks must keep reading the primary
         """
-        user = UserDao.get_user(user_id)
+        user = UserDao.get_user(user_id, replica)
         if not user:
             raise ValueError("User don't not exist.")
         return user
@@ -52,6 +52,7 @@ class UserService(BaseService):
             create_user_id=payload["user_id"],
         )
         user = UserDao.create(user)
+        CountCache.invalidate_on_commit("users")
 
         return {"user": user}
 
@@ -78,7 +79,7 @@ class UserService(BaseService):
         user.email = payload["email"]
         user.role = payload["role"]
         user.address = payload["address"]
-        user.updated_user_id = get_jwt_identity()
+        user.updated_user_id = current_identity().id
         user.phone = payload["phone"]
         user.dob = payload["dob"]
 
@@ -87,6 +88,7 @@ class UserService(BaseService):
 
         if payload.get("profile"):
             user.profile_path = payload["profile"]
+        CountCache.invalidate_on_commit("users")
 
         return {"user": user}
 
@@ -103,7 +105,8 @@ class UserService(BaseService):
         else:
             if not isinstance(user_ids, list) or not user_ids:
                 raise ValueError("Provide user ids list.")
-            user_count = UserDao.delete_users(user_ids)
+            user_count = UserDao.delete_users(user_ids, current_identity().id)
+        CountCache.invalidate_on_commit("users")
         return user_count
 
     def lock_users(payload):
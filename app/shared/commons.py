@@ -13,6 +13,20 @@ from config.logging import logger
 BATCH_SIZE = int(os.environ.get("BATCH_SIZE", 50))
 FRONTEND_URL = os.environ.get("FRONTEND_URL")
 MAX_FILE_SIZE = 1 * 1024 * 1024  # 1 MB
+COUNT_CACHE_TTL = int(os.environ.get("COUNT_CACHE_TTL", 60))
+COUNT_MODES = ("cached", "estimate", "exact", "none")
+CSV_CHUNK_SIZE = int(os.environ.get("CSV_CHUNK_SIZE", 64 * 1024))  # 64 KiB
+PROGRESS_TTL = int(os.environ.get("PROGRESS_TTL", 24 * 60 * 60))  # 1 day
+CSV_IMPORT_BATCH_SIZE = int(os.environ.get("CSV_IMPORT_BATCH_SIZE", 500))
+CSV_IMPORT_MAX_SIZE = int(
+    os.environ.get("CSV_IMPORT_MAX_SIZE", 200 * 1024 * 1024)
+)  # 200 MB
+# Seconds, an import task attempt is killed after it; a pending / running job
+# not updated for that long is considered lost
+CSV_IMPORT_TIME_LIMIT = int(os.environ.get("CSV_IMPORT_TIME_LIMIT", 60 * 60))
+CSV_IMPORT_MAX_SHARDS = int(os.environ.get("CSV_IMPORT_MAX_SHARDS", 16))
+BULK_CHUNK_SIZE = int(os.environ.get("BULK_CHUNK_SIZE", 1000))
+REVOKED_TOKEN_LRU_SIZE = int(os.environ.get("REVOKED_TOKEN_LRU_SIZE", 1024))
 
 
 def validate_request(schema):
@@ -131,7 +145,9 @@ def raise_error(name: str, message: str, status_code: int = 400):
 def paginate_response(pagination: Any, schema: Schema) -> Response:
     """
     Return a standard JSON response for paginated data.
+    `total` and `pages` are null when the count was skipped (count=none).
     """
+    counted = pagination.total is not None
     return jsonify(
         {
             "data": schema.dump(pagination.items),
@@ -139,7 +155,23 @@ def paginate_response(pagination: Any, schema: Schema) -> Response:
                 "page": pagination.page,
                 "per_page": pagination.per_page,
                 "total": pagination.total,
-                "pages": pagination.pages,
+                "pages": pagination.pages if counted else None,
+            },
+        }
+    )
+
+
+def cursor_paginate_response(page: dict, schema: Schema) -> Response:
+    """
+    Return a standard JSON response for cursor (keyset) paginated data.
+    """
+    return jsonify(
+        {
+            "data": schema.dump(page["items"]),
+            "meta": {
+                "per_page": page["per_page"],
+                "next_cursor": page["next_cursor"],
+                "prev_cursor": page["prev_cursor"],
             },
         }
     )
@@ -1,8 +1,16 @@
 # app/extension/db_extensions.py
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, DateTime
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Column, DateTime, event
+
+# bind name of the read replica in SQLALCHEMY_BINDS
+REPLICA_BIND = "replica"
+
+_use_replica = ContextVar("use_replica", default=False)
 
 
 def timeStamp(model_class):
@@ -25,3 +33,58 @@ def softDelete(model_class):
 
     model_class.soft_delete = soft_delete
     model_class.restore = restore
+
+
+@contextmanager
+def replica():
+    """Send the reads of the block to the read replica (when configured)."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Session routing reads to the "replica" bind inside `db.replica()` or for
+    statements with the `replica=True` execution option (lazily consumed
+    streams). Writes, and every read after a write in the same session, use
+    the primary so a request always reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        engines = self._db.engines
+        if (
+            bind is None
+            and REPLICA_BIND in engines
+            and engine is engines.get(None)
+            and self.reads_from_replica(clause)
+        ):
+            return engines[REPLICA_BIND]
+        return engine
+
+    def reads_from_replica(self, clause) -> bool:
+        if self.info.get("wrote") or self._flushing:
+            return False
+        if self.new or self.dirty or self.deleted:
+            return False
+        if clause is None:
+            return _use_replica.get()
+        if getattr(clause, "is_dml", False):
+            return False
+        return _use_replica.get() or clause.get_execution_options().get(
+            "replica", False
+        )
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _flushed(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _executed(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
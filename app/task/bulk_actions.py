@@ -0,0 +1,83 @@
+from celery import shared_task
+
+from app import app
+from app.dao.base_dao import BaseDao
+from app.dao.post_dao import PostDao
+from app.dao.user_dao import UserDao
+from app.extension import db
+from app.extension import redis_client as r
+from app.models import Post, User
+from app.shared.commons import BULK_CHUNK_SIZE
+from app.utils.count_cache import CountCache
+from app.utils.progress import ProgressReporter
+
+# action => (count scope, model, select-all query, chunk update returning a count)
+BULK_ACTIONS = {
+    "delete_posts": (
+        "posts",
+        Post,
+        lambda exclude_ids, filters, user_id: PostDao.all_posts_query(
+            exclude_ids, filters
+        ),
+        lambda ids, user_id: PostDao.delete_posts(ids, user_id),
+    ),
+    "delete_users": (
+        "users",
+        User,
+        lambda exclude_ids, filters, user_id: UserDao.all_users_query(
+            exclude_ids, filters, user_id
+        ),
+        lambda ids, user_id: UserDao.delete_users(ids, user_id),
+    ),
+    "lock_users": (
+        "users",
+        User,
+        lambda exclude_ids, filters, user_id: UserDao.all_users_query(
+            exclude_ids, filters, user_id
+        ),
+        lambda ids, user_id: UserDao.lock_users(ids),
+    ),
+    "unlock_users": (
+        "users",
+        User,
+        lambda exclude_ids, filters, user_id: UserDao.all_users_query(
+            exclude_ids, filters
+        ),
+        lambda ids, user_id: UserDao.unlock_users(ids),
+    ),
+}
+
+
+@shared_task(bind=True, acks_late=True)
+def run_bulk_action(self, action, user_id, exclude_ids, filters):
+    """
+    Run a select-all delete / lock / unlock in primary key order, one short
+    transaction per BULK_CHUNK_SIZE rows, so no request holds row locks on the
+    whole range. Progress is published under the `bulk_*` keys and the task
+    stops between chunks when cancelled.
+    """
+    reporter = ProgressReporter(r, self.request.id, prefix="bulk")
+    scope, model, build_query, apply = BULK_ACTIONS[action]
+
+    with app.app_context():
+        try:
+            query = build_query(exclude_ids, filters, user_id)
+            total = query.order_by(None).count() or 1
+            done = affected = 0
+
+            for ids in BaseDao.chunk_ids(query, model, BULK_CHUNK_SIZE):
+                if reporter.cancel_requested():
+                    reporter.cancelled(done / total, affected)
+                    return
+                affected += apply(ids, user_id)
+                db.session.commit()
+                CountCache.invalidate(scope)
+                done += len(ids)
+                reporter.update(done / total, affected)
+
+            reporter.finish([], affected)
+
+        except Exception as e:
+            db.session.rollback()
+            reporter.fail(str(e))
+            raise Exception(f"Bulk {action} failed: {str(e)}")
@@ -1,142 +1,481 @@
 import csv
 import json
 import os
-from datetime import datetime
+import time
+from contextlib import suppress
+from itertools import batched
 
 import redis
-from celery import shared_task
-from sqlalchemy.exc import IntegrityError
+from celery import chord, shared_task
+from sqlalchemy.exc import (
+    DataError,
+    IntegrityError,
+    OperationalError,
+    SQLAlchemyError,
+)
 
 from app import app
+from app.dao.import_job_dao import ImportJobDao
+from app.dao.post_dao import PostDao
+from app.enum.import_job import ImportJobStatus
 from app.extension import db
-from app.models import Post
-from app.shared.commons import to_datetime
-from config.celery import CeleryConfig
+from app.extension import redis_client as r
+from app.shared.commons import (
+    CSV_IMPORT_BATCH_SIZE,
+    CSV_IMPORT_TIME_LIMIT,
+    PROGRESS_TTL,
+    to_datetime,
+)
+from app.utils.count_cache import CountCache
+from app.utils.csv import ByteCountingReader
+from app.utils.progress import ProgressReporter
 
-# Redis for tracking progress
-r = redis.Redis.from_url(f"{CeleryConfig.REDIS_URL}/1")
+REQUIRED_COLUMNS = ["title", "description", "status"]
+# Transient errors retried by Celery, the import resumes from its checkpoint
+RETRY_ERRORS = (ConnectionError, redis.ConnectionError, OperationalError)
+# Errors caused by the row itself, anything else fails the whole batch
+ROW_ERRORS = (IntegrityError, DataError)
+FINISHED_STATUSES = (ImportJobStatus.SUCCESS.value, ImportJobStatus.FAILURE.value)
 
 
 @shared_task(
     bind=True,
-    autoretry_for=(ConnectionError,),
+    autoretry_for=RETRY_ERRORS,
     retry_backoff=5,
     retry_kwargs={"max_retries": 3},
+    acks_late=True,
+    reject_on_worker_lost=True,
+    time_limit=CSV_IMPORT_TIME_LIMIT,
 )
 def import_posts_from_csv(self, file_path, user_id):
-    """
-    Import posts from CSV into the database, track progress in Redis, and handle duplicates.
-    """
-    batch_size = 100
+    """Import a CSV in checkpointed chunks, resuming after the last committed row."""
     task_id = self.request.id
-    errors = []
-
-    if not os.path.exists(file_path):
-        r.set(f"csv_status:{task_id}", "FAILURE")
-        r.set(f"csv_errors:{task_id}", json.dumps([{"error": "File not found"}]))
-        return
+    reporter = ProgressReporter(r, task_id)
+    errors_key = f"csv_row_errors:{task_id}"
 
     with app.app_context():
+        job = start_job(task_id, user_id, file_path)
+        if not job:
+            return
+        resume_row = job.last_row
+
+        if not os.path.exists(file_path):
+            fail_job(job, reporter, "File not found")
+            return
+
+        errors = load_row_errors(errors_key, resume_row)
+
         try:
-            with open(file_path, newline="", encoding="utf-8") as f:
-                reader = list(csv.DictReader(f))
+            total_bytes = os.path.getsize(file_path) or 1
+            with open(file_path, "rb") as f:
+                lines = ByteCountingReader(f)
+                reader = csv.DictReader(lines)
+                if not reader.fieldnames:
+                    raise ValueError("CSV is empty")
 
-            total = len(reader)
-            if total == 0:
-                raise ValueError("CSV is empty")
+                header_error = check_header(reader.fieldnames)
+                if header_error:
+                    fail_job(job, reporter, header_error, upload=file_path)
+                    return
 
-            headers = [h.strip().lower() for h in reader[0].keys()]
-            required_cols = [
-                "title",
-                "description",
-                "status",
-            ]
-            missing_cols = [col for col in required_cols if col not in headers]
-
-            if missing_cols:
-                r.set(f"csv_status:{task_id}", "FAILURE")
-                r.set(
-                    f"csv_errors:{task_id}",
-                    json.dumps(
-                        [
-                            {
-                                "error": f"The CSV File must has 3 column : {', '.join(required_cols)}"
-                            }
-                        ]
-                    ),
-                )
-                return
-
-            seen_titles = set()  # Track CSV duplicates
-
-            for idx, row in enumerate(reader, 1):
-                title = row["title"].strip()
-
-                # Skip duplicates in CSV
-                if title in seen_titles:
-                    errors.append(
-                        {"row": idx, "error": f"The Title in row {idx} is duplicated."}
-                    )
-                    continue
-                seen_titles.add(title)
-
-                # Skip duplicates in DB
-                if Post.query.filter_by(title=title).first():
-                    errors.append(
-                        {
-                            "row": idx,
-                            "error": f"The Title in row {idx} is already taken.",
-                        }
-                    )
-                    continue
+                seen_titles = set()  # Track CSV duplicates
+                idx = 0
 
-                if int(row.get("status")) > 1:
-                    errors.append(
-                        {"row": idx, "error": f"The status in row {idx} must be 0 or 1"}
-                    )
-                    continue
-
-                post = Post(
-                    title=title,
-                    description=row.get("description"),
-                    status=int(row.get("status", 1)),
-                    create_user_id=user_id,
-                    updated_user_id=user_id,
-                    created_at=to_datetime(row.get("created_at")),
-                    updated_at=to_datetime(row.get("updated_at")),
-                )
-
-                db.session.add(post)
-
-                # Batch commit
-                if idx % batch_size == 0:
-                    try:
-                        db.session.commit()
-                    except IntegrityError as e:
-                        db.session.rollback()
-                        errors.append({"row": idx, "error": f"DB error: {str(e)}"})
-
-                # Update progress in Redis
-                progress = int((idx / total) * 100)
-                r.set(f"csv_progress:{task_id}", progress)
-
-            # Final commit for remaining posts
-            try:
-                db.session.commit()
-            except IntegrityError as e:
-                db.session.rollback()
-                errors.append({"row": "last_batch", "error": f"DB error: {str(e)}"})
+                for chunk in batched(enumerate(reader, 1), CSV_IMPORT_BATCH_SIZE):
+                    idx = chunk[-1][0]
+                    duplicated = set()
+                    for row_idx, row in chunk:
+                        title = row["title"].strip()
+                        if title in seen_titles:
+                            duplicated.add(row_idx)
+                        seen_titles.add(title)
+
+                    # Skip the rows committed before a restart
+                    pending = [item for item in chunk if item[0] > resume_row]
+                    if not pending:
+                        continue
+
+                    chunk_errors = import_chunk(pending, user_id, duplicated)
+                    save_row_errors(errors_key, chunk_errors)
+                    errors.extend(chunk_errors)
+
+                    ImportJobDao.checkpoint(job, idx)
+                    db.session.commit()
+
+                    # Update progress in Redis from the bytes read so far
+                    reporter.update(lines.bytes_read / total_bytes, idx)
+
+            if idx == 0:
+                raise ValueError("CSV is empty")
+
+            CountCache.invalidate("posts")
 
             # Save status
-            if errors:
-                r.set(f"csv_errors:{task_id}", json.dumps(errors))
-                r.set(f"csv_status:{task_id}", "FAILURE")
-            else:
-                r.set(f"csv_status:{task_id}", "SUCCESS")
-                r.set(f"csv_progress:{task_id}", 100)
+            finish_job(job, reporter, errors, idx, upload=file_path)
+            r.delete(errors_key)
+
+        except RETRY_ERRORS as e:
+            db.session.rollback()
+            if self.request.retries >= self.max_retries:
+                fail_job(job, reporter, str(e), upload=file_path)
+            raise
 
         except Exception as e:
             db.session.rollback()
-            r.set(f"csv_status:{task_id}", "FAILURE")
-            r.set(f"csv_errors:{task_id}", json.dumps([{"error": str(e)}]))
+            fail_job(job, reporter, str(e), upload=file_path)
             raise Exception(f"CSV import failed: {str(e)}")
+
+
+@shared_task(bind=True, time_limit=CSV_IMPORT_TIME_LIMIT)
+def import_posts_sharded(self, file_path, user_id, shards):
+    """Fan a CSV import out to `shards` byte-range sub-tasks under this job."""
+    job_id = self.request.id
+    reporter = ProgressReporter(r, job_id)
+
+    with app.app_context():
+        job = start_job(job_id, user_id, file_path)
+        if not job:
+            return
+
+        if not os.path.exists(file_path):
+            fail_job(job, reporter, "File not found")
+            return
+
+        try:
+            with open(file_path, "rb") as f:
+                lines = ByteCountingReader(f)
+                reader = csv.reader(lines)
+                fieldnames = next(reader, None)
+                if not fieldnames:
+                    raise ValueError("CSV is empty")
+                header_error = check_header(fieldnames)
+                if header_error:
+                    fail_job(job, reporter, header_error, upload=file_path)
+                    return
+                ranges = shard_ranges(reader, lines, shards)
+            if not ranges:
+                raise ValueError("CSV is empty")
+        except Exception as e:
+            fail_job(job, reporter, str(e), upload=file_path)
+            raise Exception(f"CSV import failed: {str(e)}")
+
+    total_bytes = ranges[-1][1] - ranges[0][0]
+    started_at = time.time()
+    shard_tasks = [
+        import_posts_shard.s(
+            job_id,
+            file_path,
+            user_id,
+            fieldnames,
+            start,
+            end,
+            first_row,
+            total_bytes,
+            started_at,
+        )
+        for start, end, first_row in ranges
+    ]
+    chord(shard_tasks)(finish_sharded_import.s(job_id, file_path))
+
+
+@shared_task(
+    bind=True,
+    ignore_result=False,
+    autoretry_for=RETRY_ERRORS,
+    retry_backoff=5,
+    retry_kwargs={"max_retries": 3},
+    acks_late=True,
+    reject_on_worker_lost=True,
+    time_limit=CSV_IMPORT_TIME_LIMIT,
+)
+def import_posts_shard(
+    self,
+    job_id,
+    file_path,
+    user_id,
+    fieldnames,
+    start,
+    end,
+    first_row,
+    total_bytes,
+    started_at,
+):
+    """Import bytes [start, end) of the CSV, resuming from the shard's checkpoint."""
+    shard_id = self.request.id
+    reporter = ProgressReporter(r, job_id, started_at=started_at)
+    errors_key = f"csv_row_errors:{shard_id}"
+
+    with app.app_context():
+        job = ImportJobDao.find_by_task_id(job_id)
+        if job.status in FINISHED_STATUSES:
+            # Given up as lost, its result is ignored
+            return {"errors": [], "aborted": True}
+        shard = start_job(shard_id, user_id)
+        if not shard:
+            # Redelivered after it finished
+            shard = ImportJobDao.find_by_task_id(shard_id)
+            return {
+                "errors": [],
+                "aborted": shard.status != ImportJobStatus.SUCCESS.value,
+            }
+        offset = shard.last_offset or start
+        resume_row = shard.last_row or first_row - 1
+        errors = load_row_errors(errors_key, resume_row)
+
+        try:
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                lines = ByteCountingReader(f, limit=end - offset)
+                reader = csv.DictReader(lines, fieldnames=fieldnames)
+                read_bytes = 0
+
+                for chunk in batched(
+                    enumerate(reader, resume_row + 1), CSV_IMPORT_BATCH_SIZE
+                ):
+                    duplicated = claim_titles(job_id, chunk)
+                    chunk_errors = import_chunk(chunk, user_id, duplicated)
+                    save_row_errors(errors_key, chunk_errors)
+                    errors.extend(chunk_errors)
+
+                    ImportJobDao.checkpoint(
+                        shard, chunk[-1][0], offset + lines.bytes_read
+                    )
+                    # keeps the job from being taken for lost while shards run
+                    ImportJobDao.touch(job)
+                    db.session.commit()
+                    resume_row = chunk[-1][0]
+
+                    pipe = r.pipeline(transaction=False)
+                    pipe.incrby(f"csv_bytes:{job_id}", lines.bytes_read - read_bytes)
+                    pipe.expire(f"csv_bytes:{job_id}", PROGRESS_TTL)
+                    pipe.incrby(f"csv_rows:{job_id}", len(chunk))
+                    pipe.expire(f"csv_rows:{job_id}", PROGRESS_TTL)
+                    done_bytes, _, done_rows, _ = pipe.execute()
+                    read_bytes = lines.bytes_read
+
+                    reporter.update(done_bytes / total_bytes, done_rows)
+
+            ImportJobDao.set_status(shard, ImportJobStatus.SUCCESS)
+            db.session.commit()
+            r.delete(errors_key)
+            return {"errors": errors, "aborted": False}
+
+        except RETRY_ERRORS as e:
+            db.session.rollback()
+            if self.request.retries < self.max_retries:
+                raise
+            return abort_shard(shard, errors, resume_row + 1, e)
+
+        except Exception as e:
+            db.session.rollback()
+            return abort_shard(shard, errors, resume_row + 1, e)
+
+
+def abort_shard(shard, errors, row, error):
+    """Mark a shard failed and return its result, so the chord callback still runs."""
+    try:
+        ImportJobDao.set_status(shard, ImportJobStatus.FAILURE)
+        db.session.commit()
+    except SQLAlchemyError:
+        # e.g. the database is still down, the job failing is what matters
+        db.session.rollback()
+    errors.append({"row": row, "error": f"Shard failed: {str(error)}"})
+    return {"errors": errors, "aborted": True}
+
+
+@shared_task
+def finish_sharded_import(results, job_id, file_path):
+    """Chord callback: merge the shard errors, fail the job when a shard aborted."""
+    errors = sorted(
+        (error for result in results for error in result["errors"]),
+        key=lambda error: error["row"],
+    )
+    aborted = any(result["aborted"] for result in results)
+    rows = int(r.get(f"csv_rows:{job_id}") or 0)
+    r.delete(f"csv_titles:{job_id}", f"csv_bytes:{job_id}", f"csv_rows:{job_id}")
+    with app.app_context():
+        CountCache.invalidate("posts")
+        job = ImportJobDao.find_by_task_id(job_id)
+        if job.status in FINISHED_STATUSES:
+            # Given up as lost meanwhile, the file may be imported again
+            remove_upload(file_path)
+            return
+        finish_job(
+            job,
+            ProgressReporter(r, job_id),
+            errors,
+            rows,
+            upload=file_path,
+            aborted=aborted,
+        )
+
+
+def finish_job(job, reporter, errors, rows=0, upload=None, aborted=False):
+    """Publish the final status and remove `upload`, row errors do not fail it."""
+    ImportJobDao.set_status(
+        job, ImportJobStatus.FAILURE if aborted else ImportJobStatus.SUCCESS
+    )
+    db.session.commit()
+    reporter.finish(errors, rows)
+    remove_upload(upload)
+
+
+def start_job(task_id, user_id, file_path=None):
+    """Mark the task's job running, None when it already finished."""
+    job = ImportJobDao.find_by_task_id(task_id) or ImportJobDao.create_job(
+        task_id, user_id
+    )
+    if job.status in FINISHED_STATUSES:
+        remove_upload(file_path)
+        return None
+    ImportJobDao.set_status(job, ImportJobStatus.RUNNING)
+    db.session.commit()
+    return job
+
+
+def load_row_errors(key, last_row):
+    """Row errors saved for the rows committed before a restart."""
+    return [
+        error
+        for error in map(json.loads, r.lrange(key, 0, -1))
+        if error["row"] <= last_row
+    ]
+
+
+def save_row_errors(key, errors):
+    """Save a chunk's row errors before its commit, so a restart keeps them."""
+    if errors:
+        pipe = r.pipeline(transaction=False)
+        pipe.rpush(key, *map(json.dumps, errors))
+        pipe.expire(key, PROGRESS_TTL)
+        pipe.execute()
+
+
+def fail_job(job, reporter, error, upload=None):
+    """Mark the job aborted with a single error message, it can be uploaded again."""
+    ImportJobDao.set_status(job, ImportJobStatus.FAILURE)
+    db.session.commit()
+    reporter.fail(error)
+    remove_upload(upload)
+
+
+def remove_upload(file_path):
+    """Delete an uploaded CSV, ignoring one already removed."""
+    if file_path:
+        with suppress(FileNotFoundError):
+            os.remove(file_path)
+
+
+def check_header(fieldnames):
+    """Return an error message when required columns are missing."""
+    headers = [h.strip().lower() for h in fieldnames]
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in headers]
+    if missing_cols:
+        return f"The CSV File must has 3 column : {', '.join(REQUIRED_COLUMNS)}"
+    return None
+
+
+def shard_ranges(reader, lines, shards):
+    """Split the rows into ~`shards` (start, end, first row) ranges on record ends."""
+    start = lines.bytes_read
+    file_size = os.fstat(lines.file.fileno()).st_size
+    target = max((file_size - start) // shards, 1)
+    ranges = []
+    first_row = 1
+    row = 0
+    for row, _ in enumerate(reader, 1):
+        if lines.bytes_read - start >= target and len(ranges) < shards - 1:
+            ranges.append((start, lines.bytes_read, first_row))
+            start = lines.bytes_read
+            first_row = row + 1
+    if row >= first_row:
+        ranges.append((start, lines.bytes_read, first_row))
+    return ranges
+
+
+def claim_titles(job_id, chunk):
+    """Claim the chunk titles, return the rows whose title another row owns."""
+    key = f"csv_titles:{job_id}"
+    pipe = r.pipeline(transaction=False)
+    for row_idx, row in chunk:
+        pipe.hsetnx(key, row["title"].strip(), row_idx)
+    for _, row in chunk:
+        pipe.hget(key, row["title"].strip())
+    pipe.expire(key, PROGRESS_TTL)
+    owners = pipe.execute()[len(chunk) : -1]
+    return {
+        row_idx for (row_idx, _), owner in zip(chunk, owners) if int(owner) != row_idx
+    }
+
+
+def import_chunk(chunk, user_id, duplicated):
+    """Validate (row number, row) pairs, insert the valid ones, return row errors."""
+    errors = []
+    # Resolve titles already in DB with one query per chunk
+    existing_titles = PostDao.get_existing_titles(
+        [row["title"].strip() for _, row in chunk]
+    )
+
+    new_posts = []
+    for idx, row in chunk:
+        title = row["title"].strip()
+
+        # Skip duplicates in CSV
+        if idx in duplicated:
+            errors.append(
+                {"row": idx, "error": f"The Title in row {idx} is duplicated."}
+            )
+            continue
+
+        # Skip duplicates in DB
+        if title.lower() in existing_titles:
+            errors.append(
+                {"row": idx, "error": f"The Title in row {idx} is already taken."}
+            )
+            continue
+
+        if int(row.get("status")) > 1:
+            errors.append(
+                {"row": idx, "error": f"The status in row {idx} must be 0 or 1"}
+            )
+            continue
+
+        new_posts.append(
+            (
+                idx,
+                {
+                    "title": title,
+                    "description": row.get("description"),
+                    "status": int(row.get("status", 1)),
+                    "create_user_id": user_id,
+                    "updated_user_id": user_id,
+                    "created_at": to_datetime(row.get("created_at")),
+                    "updated_at": to_datetime(row.get("updated_at")),
+                },
+            )
+        )
+
+    # Batch insert
+    errors.extend(insert_batch(new_posts))
+    return errors
+
+
+def insert_batch(new_posts):
+    """Insert (row number, values) pairs in a savepoint, one by one on ROW_ERRORS."""
+    if not new_posts:
+        return []
+    try:
+        with db.session.begin_nested():
+            PostDao.bulk_insert([values for _, values in new_posts])
+        return []
+    except ROW_ERRORS:
+        pass
+
+    errors = []
+    for idx, values in new_posts:
+        try:
+            with db.session.begin_nested():
+                PostDao.bulk_insert([values])
+        except ROW_ERRORS as e:
+            errors.append({"row": idx, "error": f"DB error: {str(e)}"})
+    return errors
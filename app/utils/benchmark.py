@@ -0,0 +1,104 @@
+import time
+from datetime import datetime
+
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+from app.utils.jwt import current_identity
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB, None when unsupported."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def synthetic_posts(rows: int):
+    """Yield export rows (PostDao EXPORT_COLUMNS order) without the database."""
+    now = datetime.utcnow()
+    description = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+    for i in range(1, rows + 1):
+        yield (
+            i,
+            f"Benchmark post title {i}",
+            description,
+            i % 2,
+            1,
+            1,
+            None,
+            None,
+            now,
+            now,
+        )
+
+
+def csv_export(posts, generator, **kwargs):
+    """
+    Consume a CSV export generator and measure rows/sec, chunks and peak RSS.
+    """
+    counted = {"rows": 0}
+
+    def count_rows(rows):
+        for row in rows:
+            counted["rows"] += 1
+            yield row
+
+    rss_before = peak_rss_kb()
+    started = time.perf_counter()
+    chunks = size = 0
+    for chunk in generator(count_rows(posts), **kwargs):
+        chunks += 1
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "rows": counted["rows"],
+        "chunks": chunks,
+        "bytes": size,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": int(counted["rows"] / elapsed) if elapsed else None,
+        "peak_rss_kb_before": rss_before,
+        "peak_rss_kb_after": peak_rss_kb(),
+    }
+
+
+def jwt_verification(app, headers: dict, requests: int, calls: int):
+    """
+    Time JWT handling of `requests` requests that each read the identity
+    `calls` times (middleware, DAOs, services): verified on every call as
+    before, and verified once per request through `current_identity`.
+    The bare request context cost is measured and subtracted.
+    """
+
+    def per_call():
+        verify_jwt_in_request()
+        get_jwt()
+
+    def cached():
+        current_identity()
+
+    def run(fn):
+        started = time.perf_counter()
+        for _ in range(requests):
+            # fresh app context so `g` is per request as under WSGI
+            with app.app_context(), app.test_request_context(headers=headers):
+                for _ in range(calls):
+                    fn()
+        return time.perf_counter() - started
+
+    baseline = run(lambda: None)
+    results = {}
+    for name, fn in (("per_call", per_call), ("cached", cached)):
+        elapsed = run(fn) - baseline
+        results[f"{name}_us_per_request"] = round(elapsed / requests * 1e6, 1)
+    results["speedup"] = (
+        round(results["per_call_us_per_request"] / results["cached_us_per_request"], 2)
+        if results["cached_us_per_request"] > 0
+        else None
+    )
+    return results
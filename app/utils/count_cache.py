@@ -0,0 +1,133 @@
+import hashlib
+import json
+
+import redis
+from sqlalchemy import event, text
+
+from app.extension import db
+from app.extension import redis_client as r
+from app.shared.commons import COUNT_CACHE_TTL
+from app.shared.database import RoutingSession
+from app.utils.decorators import static_all_methods
+from app.utils.log import log_handler
+from app.utils.request import clean_filters
+
+
+@static_all_methods
+class CountCache:
+    """
+    Cache list totals in Redis per scope and normalized filter set.
+
+    Each scope (e.g. "posts") has a version number which is bumped on every
+    write that can change a total, so stale keys are simply never read again
+    and expire through their TTL.
+    """
+
+    # Added by the DAOs on every call and changing the total by at most one
+    # row, they do not make a list "filtered" for the estimate count mode.
+    # owner_id is not one: an owner-scoped list is always counted.
+    SCOPE_KEYS = ("exclude_user_id",)
+
+    def total(scope: str, filters: dict, query, mode: str = "cached"):
+        """
+        Resolve the total for `query` according to the count mode.
+
+        - cached:   cached total, counted and cached on a miss.
+        - estimate: cached total, else table statistics when unfiltered.
+                    Scope keys (SCOPE_KEYS) are ignored and the statistics
+                    include soft-deleted rows, so it is an upper bound.
+        - exact:    always counted, the cache is refreshed.
+        - none:     no count at all, returns None.
+        """
+        if mode == "none":
+            return None
+
+        key = CountCache.key(scope, filters)
+        if mode in ("cached", "estimate") and key:
+            cached = CountCache.get(key)
+            if cached is not None:
+                return cached
+
+        if mode == "estimate" and not CountCache.is_filtered(filters):
+            estimate = CountCache.table_estimate(scope)
+            if estimate is not None:
+                return estimate
+
+        total = query.order_by(None).count()
+        if key:
+            CountCache.set(key, total)
+        return total
+
+    def is_filtered(filters: dict) -> bool:
+        """True when the user filtered the list beyond the caller's scope."""
+        return any(key not in CountCache.SCOPE_KEYS for key in clean_filters(filters))
+
+    def key(scope: str, filters: dict):
+        """Build the cache key, None when Redis is unavailable."""
+        normalized = json.dumps(clean_filters(filters), sort_keys=True, default=str)
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        try:
+            version = r.get(f"count_version:{scope}") or b"0"
+        except redis.RedisError as e:
+            log_handler("warning", "CountCache : key =>", e)
+            return None
+        return f"count:{scope}:{version.decode()}:{digest}"
+
+    def get(key: str):
+        """Get a cached total."""
+        try:
+            value = r.get(key)
+        except redis.RedisError as e:
+            log_handler("warning", "CountCache : get =>", e)
+            return None
+        return int(value) if value is not None else None
+
+    def set(key: str, total: int):
+        """Cache a total for COUNT_CACHE_TTL seconds."""
+        try:
+            r.set(key, total, ex=COUNT_CACHE_TTL)
+        except redis.RedisError as e:
+            log_handler("warning", "CountCache : set =>", e)
+
+    def invalidate(scope: str):
+        """Drop every cached total of a scope by bumping its version."""
+        try:
+            r.incr(f"count_version:{scope}")
+        except redis.RedisError as e:
+            log_handler("warning", "CountCache : invalidate =>", e)
+
+    def invalidate_on_commit(scope: str, session=None):
+        """
+        Invalidate a scope once the session writing to it commits, so a list
+        read before the commit cannot cache the old total under the new version.
+        """
+        session = session or db.session
+        session.info.setdefault("invalidated_count_scopes", set()).add(scope)
+
+    def table_estimate(table: str):
+        """
+        Row estimate from MySQL table statistics, None on other databases.
+        TABLE_ROWS counts soft-deleted rows too.
+        """
+        if db.engine.dialect.name != "mysql":
+            return None
+        return db.session.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ),
+            {"table": table},
+        ).scalar()
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _invalidate_committed_scopes(session):
+    for scope in session.info.pop("invalidated_count_scopes", ()):
+        CountCache.invalidate(scope)
+
+
+@event.listens_for(RoutingSession, "after_soft_rollback")
+def _drop_invalidated_scopes(session, previous_transaction):
+    # a rolled back savepoint leaves the outer transaction's writes
+    if not previous_transaction.nested:
+        session.info.pop("invalidated_count_scopes", None)
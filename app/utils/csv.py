@@ -1,8 +1,46 @@
 import csv
+import hashlib
+import zlib
 from io import StringIO
 
+import zstandard
+
+from app.shared.commons import CSV_CHUNK_SIZE
 from app.utils.decorators import static_all_methods
 
+POST_CSV_HEADER = (
+    '"id","title","description","status",'
+    '"created_user_id","updated_user_id",'
+    '"deleted_user_id","deleted_at","created_at","updated_at"\n'
+)
+
+# format => (mimetype, file extension)
+CSV_EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "gzip": ("application/gzip", "csv.gz"),
+    "zstd": ("application/zstd", "csv.zst"),
+}
+
+
+class ByteCountingReader:
+    """
+    Iterate the text lines of a binary file while counting consumed bytes.
+    With `limit`, iteration stops once `limit` bytes have been read.
+    """
+
+    def __init__(self, file, encoding: str = "utf-8", limit: int | None = None):
+        self.file = file
+        self.encoding = encoding
+        self.limit = limit
+        self.bytes_read = 0
+
+    def __iter__(self):
+        for line in self.file:
+            self.bytes_read += len(line)
+            yield line.decode(self.encoding)
+            if self.limit is not None and self.bytes_read >= self.limit:
+                return
+
 
 @static_all_methods
 class CSV:
@@ -10,33 +48,53 @@ class CSV:
     Utility class for generating CSV data using streaming.
     """
 
-    def post_csv_generator(posts):
+    def post_csv_generator(rows, chunk_size: int = CSV_CHUNK_SIZE):
         """
         Generate CSV rows for Post records.
+        `rows` are tuples in POST_CSV_HEADER order (PostDao EXPORT_COLUMNS).
+        One buffer and writer are reused and rows are yielded in chunks of
+        about `chunk_size` characters instead of one string per row.
         """
-        yield (
-            '"id","title","description","status",'
-            '"created_user_id","updated_user_id",'
-            '"deleted_user_id","deleted_at","created_at","updated_at"\n'
-        )
-
-        for post in posts:
-            output = StringIO()
-            writer = csv.writer(output, quoting=csv.QUOTE_ALL)
-
-            writer.writerow(
-                [
-                    post.id,
-                    post.title,
-                    post.description,
-                    post.status,
-                    post.create_user_id,
-                    post.updated_user_id,
-                    post.deleted_user_id,
-                    post.deleted_at,
-                    post.created_at,
-                    post.updated_at,
-                ]
-            )
+        output = StringIO()
+        writer = csv.writer(output, quoting=csv.QUOTE_ALL)
+        output.write(POST_CSV_HEADER)
+
+        for row in rows:
+            writer.writerow(row)
 
+            if output.tell() >= chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+
+        if output.tell():
             yield output.getvalue()
+
+    def compress(chunks, encoding: str):
+        """
+        Compress a stream of CSV chunks incrementally with gzip or zstd.
+        Only the compressor state is kept in memory, never the whole file.
+        """
+        if encoding == "zstd":
+            compressor = zstandard.ZstdCompressor(level=3).compressobj()
+        else:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode("utf-8"))
+            if data:
+                yield data
+
+        yield compressor.flush()
+
+    def save_upload(file, path: str, chunk_size: int = CSV_CHUNK_SIZE) -> str:
+        """
+        Save an uploaded file in chunks and return its sha256 hex digest,
+        used to recognize the same upload sent twice.
+        """
+        digest = hashlib.sha256()
+        with open(path, "wb") as out:
+            while chunk := file.stream.read(chunk_size):
+                digest.update(chunk)
+                out.write(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,64 @@
+from datetime import date
+
+from sqlalchemy import text
+
+from app.dao.post_dao import PostDao
+from app.dao.user_dao import UserDao
+from app.extension import db
+from app.models import PasswordReset, Post, RefreshToken, User
+from app.models.scopes import PostScopes, UserScopes
+
+# Representative queries built the same way the DAOs / token utils build them
+QUERY_CHECKS = {
+    "PostDao.paginate": lambda: PostDao.filters_query(Post.query, {}),
+    "PostDao.paginate (own posts)": lambda: PostDao.filters_query(
+        Post.query.filter_by(create_user_id=1), {}
+    ),
+    "PostDao.paginate (date)": lambda: PostDao.filters_query(
+        Post.query, {"date": date.today().isoformat()}
+    ),
+    "PostDao.find_one": lambda: PostScopes.active(Post.query).filter_by(id=1),
+    "PostDao.get_by_title": lambda: Post.query.filter(Post.title == "title"),
+    "UserDao.paginate": lambda: UserDao.filters_query(
+        User.query, {}, current_user_id=1
+    ),
+    "UserDao.paginate (role)": lambda: UserDao.filters_query(
+        User.query, {"role": 0}, current_user_id=1
+    ),
+    "UserDao.find_one": lambda: UserScopes.active(User.query).filter_by(
+        email="admin@admin.com"
+    ),
+    "UserDao.is_valid_user": lambda: User.query.filter_by(
+        email="admin@admin.com", deleted_at=None, lock_flg=False
+    ),
+    "PasswordResetDao.find_one (email)": lambda: PasswordReset.query.filter(
+        PasswordReset.deleted_at.is_(None)
+    ).filter_by(email="admin@admin.com"),
+    "PasswordResetDao.find_one (token)": lambda: PasswordReset.query.filter(
+        PasswordReset.deleted_at.is_(None)
+    ).filter_by(token="token"),
+    "is_refresh_token_revoked": lambda: RefreshToken.query.filter_by(token_hash="hash"),
+    "revoke_all_refresh_token": lambda: RefreshToken.query.filter_by(user_id=1),
+}
+
+
+def explain(query):
+    """Run MySQL EXPLAIN for a query and return the plan rows."""
+    sql = query.statement.compile(
+        dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    return db.session.execute(text(f"EXPLAIN {sql}")).mappings().all()
+
+
+def run():
+    """
+    EXPLAIN every query in QUERY_CHECKS.
+    Returns (name, plan rows, uses_index) tuples, a plan row doing a full
+    table scan without any key marks the query as not using an index.
+    """
+    results = []
+    for name, build in QUERY_CHECKS.items():
+        plan = explain(build())
+        uses_index = all(row["key"] is not None or row["type"] != "ALL" for row in plan)
+        results.append((name, plan, uses_index))
+    return results
@@ -1,8 +1,36 @@
-from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from flask import g
+from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
 
 
-def auth_user():
-    verify_jwt_in_request()
-    claim = get_jwt() or {}
+class AuthIdentity:
+    """Authenticated user of the current request, read from the JWT once."""
+
+    __slots__ = ("id", "user", "claims")
+
+    def __init__(self, identity, claims: dict):
+        self.id = identity
+        self.claims = claims
+        self.user = claims.get("user")
+
+    @property
+    def role(self):
+        return int(self.user["role"]) if self.user else None
 
-    return claim.get("user")
+
+def current_identity(optional: bool = False) -> AuthIdentity | None:
+    """
+    Verify the request JWT on first use and keep the identity on `g`, so the
+    middleware, DAOs and services share one verification per request.
+    With `optional`, a request without a token returns None.
+    """
+    identity = g.get("auth_identity")
+    if identity is None:
+        if verify_jwt_in_request(optional=optional) is None:
+            return None
+        identity = g.auth_identity = AuthIdentity(get_jwt_identity(), get_jwt())
+    return identity
+
+
+def auth_user():
+    """The "user" claim of the authenticated user."""
+    return current_identity().user
@@ -0,0 +1,141 @@
+import json
+import time
+
+from app.shared.commons import PROGRESS_TTL
+
+
+class ProgressReporter:
+    """
+    Publish background task progress to Redis.
+
+    Keys are `{prefix}_progress`, `{prefix}_stats`, `{prefix}_status` and
+    `{prefix}_errors` suffixed with `:{task_id}`. Progress is only written
+    when the percentage changes or `interval` seconds have passed, every
+    write is a single pipeline and all keys expire after `ttl` seconds.
+    Pass `started_at` (epoch seconds) when several workers report one task.
+    """
+
+    FINAL_STATUSES = ("SUCCESS", "FAILURE", "CANCELLED")
+
+    def __init__(
+        self,
+        client,
+        task_id: str,
+        prefix: str = "csv",
+        interval: float = 1.0,
+        ttl: int = PROGRESS_TTL,
+        started_at: float | None = None,
+    ):
+        self.client = client
+        self.task_id = task_id
+        self.prefix = prefix
+        self.interval = interval
+        self.ttl = ttl
+        self.started_at = started_at or time.time()
+        self.published_at = None
+        self.progress = None
+
+    def key(self, name: str) -> str:
+        return f"{self.prefix}_{name}:{self.task_id}"
+
+    def update(self, fraction: float, rows: int, force: bool = False):
+        """Publish progress (0..1 done) and throughput if it is worth a write."""
+        fraction = min(max(fraction, 0.0), 1.0)
+        progress = int(fraction * 100)
+        now = time.time()
+        if (
+            not force
+            and progress == self.progress
+            and now - self.published_at < self.interval
+        ):
+            return
+
+        elapsed = now - self.started_at
+        stats = {
+            "rows": rows,
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+            "eta": (
+                round(elapsed * (1 - fraction) / fraction, 1) if fraction else None
+            ),
+        }
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(self.key("progress"), progress, ex=self.ttl)
+        pipe.set(self.key("stats"), json.dumps(stats), ex=self.ttl)
+        pipe.execute()
+        self.progress = progress
+        self.published_at = now
+
+    def finish(self, errors: list, rows: int = 0):
+        """Publish the final SUCCESS / FAILURE status with the collected errors."""
+        if not errors:
+            self.update(1.0, rows, force=True)
+        pipe = self.client.pipeline(transaction=False)
+        if errors:
+            pipe.set(self.key("errors"), json.dumps(errors), ex=self.ttl)
+        pipe.set(self.key("status"), "FAILURE" if errors else "SUCCESS", ex=self.ttl)
+        pipe.execute()
+
+    def fail(self, error: str):
+        """Publish FAILURE with a single error message."""
+        self.finish([{"error": error}])
+
+    def cancel(self):
+        """Ask the task to stop, it checks `cancel_requested()` between chunks."""
+        self.client.set(self.key("cancel"), 1, ex=self.ttl)
+
+    def cancel_requested(self) -> bool:
+        return bool(self.client.exists(self.key("cancel")))
+
+    def cancelled(self, fraction: float, rows: int):
+        """Publish CANCELLED with the progress reached so far."""
+        self.update(fraction, rows, force=True)
+        self.client.set(self.key("status"), "CANCELLED", ex=self.ttl)
+
+    def read(self, missing: dict | None = None) -> dict | None:
+        """
+        Read the published state in one round trip. Returns `missing` when
+        nothing was published yet, or the keys expired, if it is given.
+        """
+        progress, status, errors, stats = self.client.mget(
+            self.key("progress"),
+            self.key("status"),
+            self.key("errors"),
+            self.key("stats"),
+        )
+        if missing is not None and progress is None and status is None:
+            return missing
+        response = {
+            "progress": int(progress) if progress else 0,
+            "status": status.decode() if status else "PENDING",
+            **(json.loads(stats) if stats else {}),
+        }
+        if response["status"] == "FAILURE":
+            response["errors"] = json.loads(errors.decode()) if errors else []
+        return response
+
+    def events(self, heartbeat: float = 15.0, poll: float = 1.0):
+        """
+        Yield the current state, then every change until the task finishes,
+        reading it every `poll` seconds. Each read borrows a pooled connection
+        for one round trip, a stream never holds one. Yields None after
+        `heartbeat` seconds without changes so the caller can keep the
+        connection alive. Stops when the state is missing: unknown task, or
+        keys expired after the worker died.
+        """
+        state = None
+        idle = 0.0
+        while True:
+            current = self.read(missing={})
+            if not current:
+                return
+            if current != state:
+                state = current
+                idle = 0.0
+                yield state
+            elif idle >= heartbeat:
+                idle = 0.0
+                yield None
+            if state["status"] in self.FINAL_STATUSES:
+                return
+            time.sleep(poll)
+            idle += poll
@@ -1,5 +1,7 @@
 from flask import request
 
+from app.shared.commons import COUNT_MODES, raise_error
+
 
 def request_query(schema):
     return {k: request.args.get(k, type=t) for k, t in schema.items()}
@@ -7,3 +9,10 @@ def request_query(schema):
 
 def clean_filters(filters: dict) -> dict:
     return {k: v for k, v in filters.items() if v not in ("", None)}
+
+
+def request_count_mode(default: str = "cached") -> str:
+    mode = request.args.get("count", default, type=str)
+    if mode not in COUNT_MODES:
+        raise_error("count", f"The count must be one of {', '.join(COUNT_MODES)}.")
+    return mode
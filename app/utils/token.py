@@ -3,6 +3,7 @@ from datetime import datetime
 
 from app.extension import db
 from app.models.refresh_token import RefreshToken
+from app.utils.token_cache import ACTIVE, REVOKED, RefreshTokenCache
 
 
 def hash_token(token: str) -> str:
@@ -10,24 +11,47 @@ def hash_token(token: str) -> str:
 
 
 def save_refresh_token(user_id, refresh_token, expires_at):
-    token = RefreshToken(
-        user_id=user_id, token_hash=hash_token(refresh_token), expires_at=expires_at
-    )
+    token_hash = hash_token(refresh_token)
+    token = RefreshToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
     db.session.add(token)
+    RefreshTokenCache.issue(db.session(), token_hash, expires_at)
 
 
-def revoke_refresh_token(refresh_token):
+def revoke_refresh_token(refresh_token) -> bool:
+    """
+    Revoke a token, True when it was still live. The conditional UPDATE is
+    what finally accepts a refresh, so a stale cache or a replayed token
+    racing its own refresh can never rotate a token twice.
+    """
     token_hash = hash_token(refresh_token)
-    token = RefreshToken.query.filter_by(token_hash=token_hash, revoked=False).first()
-    if token:
-        token.revoked = True
+    revoked = RefreshToken.query.filter_by(token_hash=token_hash, revoked=False).update(
+        {"revoked": True}, synchronize_session=False
+    )
+    RefreshTokenCache.revoke([token_hash])
+    return bool(revoked)
 
 
 def revoke_all_refresh_token(user_id):
+    token_hashes = [
+        token_hash
+        for (token_hash,) in db.session.query(RefreshToken.token_hash).filter_by(
+            user_id=user_id, revoked=False
+        )
+    ]
     RefreshToken.query.filter_by(user_id=user_id).update({"revoked": True})
+    RefreshTokenCache.revoke(token_hashes)
 
 
 def is_refresh_token_revoked(refresh_token) -> bool:
     token_hash = hash_token(refresh_token)
+    state = RefreshTokenCache.get(token_hash)
+    if state is not None:
+        return state == REVOKED
+
     token = RefreshToken.query.filter_by(token_hash=token_hash).first()
-    return (not token) or token.revoked or token.expires_at < datetime.utcnow()
+    if not token or token.expires_at < datetime.utcnow():
+        return True
+    RefreshTokenCache.set(
+        token_hash, REVOKED if token.revoked else ACTIVE, token.expires_at
+    )
+    return token.revoked
@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import redis
+from sqlalchemy import event
+
+from app.extension import redis_client as r
+from app.shared.commons import REVOKED_TOKEN_LRU_SIZE
+from app.shared.database import RoutingSession
+from app.utils.decorators import static_all_methods
+from app.utils.log import log_handler
+from config.jwt import JWTConfig
+
+ACTIVE = b"active"
+REVOKED = b"revoked"
+
+# no refresh token lives longer than this, used when the expiry is unknown
+MAX_TOKEN_TTL = max(
+    JWTConfig.JWT_REFRESH_TOKEN_EXPIRES, JWTConfig.JWT_REMEMBER_ME_EXPIRES
+)
+
+
+class RevokedLRU:
+    """Thread safe, size bounded set of revoked token hashes."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.hashes = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, token_hash: str):
+        with self.lock:
+            self.hashes[token_hash] = None
+            self.hashes.move_to_end(token_hash)
+            while len(self.hashes) > self.size:
+                self.hashes.popitem(last=False)
+
+    def __contains__(self, token_hash: str) -> bool:
+        with self.lock:
+            if token_hash not in self.hashes:
+                return False
+            self.hashes.move_to_end(token_hash)
+            return True
+
+
+_revoked = RevokedLRU(REVOKED_TOKEN_LRU_SIZE)
+
+
+@static_all_methods
+class RefreshTokenCache:
+    """
+    Cache the state of refresh tokens so refresh checks skip the database.
+
+    Every token hash has a `refresh_token:{hash}` key holding "active" or
+    "revoked" which expires with the token. Revocation is final, so revoked
+    hashes are also kept in a small per process LRU. The refresh_tokens
+    table stays the source of truth: a miss, or Redis being unavailable,
+    falls back to it.
+    """
+
+    def key(token_hash: str) -> str:
+        return f"refresh_token:{token_hash}"
+
+    def ttl(expires_at: datetime) -> int:
+        return int((expires_at - datetime.utcnow()).total_seconds())
+
+    def get(token_hash: str):
+        """Cached state (ACTIVE / REVOKED) of a token, None when unknown."""
+        if token_hash in _revoked:
+            return REVOKED
+        try:
+            state = r.get(RefreshTokenCache.key(token_hash))
+        except redis.RedisError as e:
+            log_handler("warning", "RefreshTokenCache : get =>", e)
+            return None
+        if state == REVOKED:
+            _revoked.add(token_hash)
+        return state
+
+    def set(token_hash: str, state: bytes, expires_at: datetime):
+        """Cache a state until the token expires."""
+        if state == REVOKED:
+            _revoked.add(token_hash)
+        ttl = RefreshTokenCache.ttl(expires_at)
+        if ttl <= 0:
+            return
+        try:
+            r.set(RefreshTokenCache.key(token_hash), state, ex=ttl)
+        except redis.RedisError as e:
+            log_handler("warning", "RefreshTokenCache : set =>", e)
+
+    def issue(session, token_hash: str, expires_at: datetime):
+        """Mark a new token active once the session saving it commits."""
+        session.info.setdefault("issued_refresh_tokens", []).append(
+            (token_hash, expires_at)
+        )
+
+    def revoke(token_hashes: list):
+        """
+        Mark tokens revoked, keeping the expiry of known keys. Done before the
+        commit on purpose: a failed commit only rejects a token early.
+        """
+        for token_hash in token_hashes:
+            _revoked.add(token_hash)
+        if not token_hashes:
+            return
+        keys = [RefreshTokenCache.key(token_hash) for token_hash in token_hashes]
+        try:
+            pipe = r.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(key, REVOKED, xx=True, keepttl=True)
+            updated = pipe.execute()
+            for key, done in zip(keys, updated):
+                if not done:
+                    pipe.set(key, REVOKED, ex=MAX_TOKEN_TTL)
+            pipe.execute()
+        except redis.RedisError as e:
+            log_handler("warning", "RefreshTokenCache : revoke =>", e)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _cache_issued_tokens(session):
+    for token_hash, expires_at in session.info.pop("issued_refresh_tokens", []):
+        RefreshTokenCache.set(token_hash, ACTIVE, expires_at)
+
+
+@event.listens_for(RoutingSession, "after_soft_rollback")
+def _drop_issued_tokens(session, previous_transaction):
+    session.info.pop("issued_refresh_tokens", None)
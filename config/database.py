@@ -14,6 +14,24 @@ Environment Variables:
     - DB_HOST: Database host. Defaults to 'localhost'.
     - DB_PORT: Database port. Defaults to '3306'.
     - DB_NAME: Database name. Defaults to 'flask_db'.
+    - DB_URI: Full primary URI, overrides the DB_* parameters above (e.g. a
+      SQLite file for tests).
+    - SEARCH_BACKEND: Post title/description search, 'like' or 'fulltext'. Defaults to 'like'.
+    - DB_REPLICA_HOST / DB_REPLICA_PORT: MySQL read replica, same credentials and
+      database name as the primary. Unset by default (no replica).
+    - DB_REPLICA_URI: Full replica URI, overrides DB_REPLICA_HOST (e.g. a SQLite
+      file for local testing).
+    - DB_POOL_PROFILE: 'web' or 'worker'. Defaults to 'worker' under the celery
+      command, else 'web'.
+    - DB_POOL_SIZE / DB_MAX_OVERFLOW: Web pool size and overflow. Defaults to 10 / 20.
+    - DB_WORKER_POOL_SIZE / DB_WORKER_MAX_OVERFLOW: Celery worker process pool
+      size and overflow. Defaults to 2 / 3.
+    - DB_POOL_TIMEOUT: Seconds to wait for a free connection. Defaults to 30.
+    - DB_POOL_RECYCLE: Seconds before a connection is replaced, keep it below
+      MySQL wait_timeout. Defaults to 1800.
+    - DB_POOL_PRE_PING: Check connections on checkout. Defaults to 'true'.
+    - DB_CONNECT_TIMEOUT / DB_READ_TIMEOUT / DB_WRITE_TIMEOUT: PyMySQL socket
+      timeouts in seconds, only passed to mysql engines. Defaults to 10 / 60 / 60.
 
 DatabaseConfig Class Attributes:
     - SECRET_KEY (str): Flask secret key.
@@ -24,6 +42,15 @@ DatabaseConfig Class Attributes:
     - DB_NAME (str): Database name.
     - SQLALCHEMY_DATABASE_URI (str): SQLAlchemy connection URI.
     - SQLALCHEMY_TRACK_MODIFICATIONS (bool): Disable Flask-SQLAlchemy event notifications.
+    - SEARCH_BACKEND (str): 'fulltext' uses MySQL FULLTEXT (SQLite FTS5) indexes.
+    - SQLALCHEMY_BINDS (dict): "replica" bind when a replica is configured, with
+      the same pool options as the primary.
+    - DB_POOL_PROFILES (dict): Pool size / overflow per process type.
+    - DB_CONNECT_ARGS (dict): PyMySQL socket timeouts.
+    - DB_POOL_OPTIONS (dict): Pool options of the selected profile, shared by
+      the primary and the replica.
+    - SQLALCHEMY_ENGINE_OPTIONS (dict): Pool and connection options of the
+      primary.
 
 Usage:
     from config.database import DatabaseConfig
@@ -32,13 +59,22 @@ Usage:
 """
 
 import os
+import sys
 
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def mysql_connect_args(uri: str, connect_args: dict) -> dict:
+    """Engine options passing `connect_args`, empty unless `uri` is a mysql URL."""
+    if make_url(uri).get_backend_name() != "mysql":
+        return {}
+    return {"connect_args": connect_args}
+
+
 class DatabaseConfig:
     """
     Centralized database configuration for Flask and SQLAlchemy.
@@ -56,8 +92,66 @@ class DatabaseConfig:
 
     # SQLAlchemy connection URI
     SQLALCHEMY_DATABASE_URI = (
-        f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+        os.getenv("DB_URI")
+        or f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    )
+
+    # Optional read replica, used by reads inside db.replica()
+    DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST")
+    DB_REPLICA_PORT = os.getenv("DB_REPLICA_PORT", DB_PORT)
+    DB_REPLICA_URI = os.getenv("DB_REPLICA_URI") or (
+        f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_REPLICA_HOST}:{DB_REPLICA_PORT}/{DB_NAME}"
+        if DB_REPLICA_HOST
+        else None
     )
 
     # Disable track modifications to save resources
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Post search backend: "like" (default) or "fulltext"
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "like")
+
+    # Connection pool, tuned per process type
+    DB_POOL_PROFILE = os.getenv("DB_POOL_PROFILE") or (
+        "worker" if "celery" in os.path.basename(sys.argv[0]) else "web"
+    )
+    DB_POOL_PROFILES = {
+        # request threads share the pool, allow bursts through overflow
+        "web": {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+        },
+        # one task at a time per prefork child, keep MySQL connections low
+        "worker": {
+            "pool_size": int(os.getenv("DB_WORKER_POOL_SIZE", 2)),
+            "max_overflow": int(os.getenv("DB_WORKER_MAX_OVERFLOW", 3)),
+        },
+    }
+    # PyMySQL only keyword arguments
+    DB_CONNECT_ARGS = {
+        "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", 10)),
+        "read_timeout": int(os.getenv("DB_READ_TIMEOUT", 60)),
+        "write_timeout": int(os.getenv("DB_WRITE_TIMEOUT", 60)),
+    }
+    DB_POOL_OPTIONS = {
+        **DB_POOL_PROFILES[DB_POOL_PROFILE],
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **DB_POOL_OPTIONS,
+        **mysql_connect_args(SQLALCHEMY_DATABASE_URI, DB_CONNECT_ARGS),
+    }
+    # A bind given as a bare URL would not get SQLALCHEMY_ENGINE_OPTIONS
+    SQLALCHEMY_BINDS = (
+        {
+            "replica": {
+                **DB_POOL_OPTIONS,
+                "url": DB_REPLICA_URI,
+                **mysql_connect_args(DB_REPLICA_URI, DB_CONNECT_ARGS),
+            }
+        }
+        if DB_REPLICA_URI
+        else {}
+    )
@@ -0,0 +1,24 @@
+import os
+
+from dotenv import load_dotenv
+
+from config.celery import CeleryConfig
+
+# Load environment variables from .env
+load_dotenv()
+
+
+class RedisConfig:
+    """
+    Shared Redis connection pool used by the app, tasks and rate limiter.
+    Database 1 keeps cache / progress keys apart from the Celery broker (0).
+    """
+
+    REDIS_CACHE_URL = f"{CeleryConfig.REDIS_URL}/1"
+    # Connections per process (web worker / celery worker)
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 20))
+    # Seconds
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 5))
+    REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 2))
+    # PING idle connections older than this before reuse
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
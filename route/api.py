@@ -8,9 +8,12 @@ from app.controllers.auth_controller import (
     register,
     reset_password,
 )
+from app.controllers.bulk_controller import bulk_progress, cancel_bulk
+from app.controllers.monitor_controller import db_pool_stats
 from app.controllers.post_controller import (
     create_post,
     csv_progress,
+    csv_progress_stream,
     delete_posts,
     import_csv,
     post_list,
@@ -39,6 +42,7 @@ from config.logging import logger
 user_bp = Blueprint("user", __name__, url_prefix="/api/users")
 auth_bp = Blueprint("auth", __name__, url_prefix="/api")
 post_bp = Blueprint("post", __name__, url_prefix="/api/posts")
+monitor_bp = Blueprint("monitor", __name__, url_prefix="/api/monitor")
 
 
 # Apply rate limit to the whole blueprint
@@ -62,6 +66,8 @@ user_bp.post("/update/<int:id>")(update_user)
 user_bp.post("/multiple-delete")(delete_users)
 user_bp.post("/lock")(lock_users)
 user_bp.post("/unlock")(unlock_users)
+user_bp.get("/bulk-progress/<task_id>")(bulk_progress)
+user_bp.post("/bulk-cancel/<task_id>")(cancel_bulk)
 user_bp.post("/change-password/<int:id>")(change_password)
 
 # Post Route
@@ -71,10 +77,17 @@ post_bp.get("/show/<int:post_id>")(show_post)
 post_bp.post("/create")(create_post)
 post_bp.put("/update/<int:id>")(update_post)
 post_bp.post("/multiple-delete")(delete_posts)
+post_bp.get("/bulk-progress/<task_id>")(bulk_progress)
+post_bp.post("/bulk-cancel/<task_id>")(cancel_bulk)
 post_bp.post("/export/csv")(stream_csv_export)
 post_bp.post("/import/csv")(import_csv)
 post_bp.get("/csv-progress/<task_id>")(csv_progress)
+post_bp.get("/csv-progress/<task_id>/stream")(csv_progress_stream)
+
+# Monitor Route
+before_middleware(monitor_bp, user_middleware)
+monitor_bp.get("/db-pool")(db_pool_stats)
 
 
 # export all Blueprint
-__all__ = ["user_bp", "auth_bp", "post_bp"]
+__all__ = ["user_bp", "auth_bp", "post_bp", "monitor_bp"]
@@ -0,0 +1,25 @@
+import os
+import tempfile
+
+import pytest
+
+# Config is read on import: point the primary and the replica at two SQLite
+# files before the app is loaded
+_db_dir = tempfile.mkdtemp()
+os.environ["DB_URI"] = f"sqlite:///{_db_dir}/primary.db"
+os.environ["DB_REPLICA_URI"] = f"sqlite:///{_db_dir}/replica.db"
+
+from app import app as flask_app
+from app.extension import db
+
+
+@pytest.fixture
+def app():
+    """App context with empty tables on the primary and the replica."""
+    with flask_app.app_context():
+        for engine in db.engines.values():
+            db.metadata.create_all(engine)
+        yield flask_app
+        db.session.remove()
+        for engine in db.engines.values():
+            db.metadata.drop_all(engine)
@@ -0,0 +1,29 @@
+from unittest import mock
+
+from app.extension import db
+from app.models import User
+from app.utils.count_cache import CountCache
+
+
+def test_invalidate_on_commit_waits_for_the_commit(app):
+    with mock.patch.object(CountCache, "invalidate") as invalidate:
+        db.session.add(User(id=1, name="user", email="user@a.b"))
+        CountCache.invalidate_on_commit("users")
+        db.session.flush()
+        invalidate.assert_not_called()
+        db.session.commit()
+        invalidate.assert_called_once_with("users")
+
+
+def test_invalidate_on_commit_is_dropped_on_rollback(app):
+    with mock.patch.object(CountCache, "invalidate") as invalidate:
+        db.session.add(User(id=1, name="user", email="user@a.b"))
+        CountCache.invalidate_on_commit("users")
+        db.session.rollback()
+        db.session.commit()
+        invalidate.assert_not_called()
+
+
+def test_owner_scoped_list_is_filtered():
+    assert not CountCache.is_filtered({"exclude_user_id": 1, "name": ""})
+    assert CountCache.is_filtered({"owner_id": 1})
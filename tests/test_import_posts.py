@@ -0,0 +1,58 @@
+import csv
+from itertools import count
+from unittest import mock
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+import app.task.import_posts as import_posts
+from app.enum.import_job import ImportJobStatus
+from app.extension import db
+from app.models import ImportJob, Post, User
+
+ROWS = 10
+
+
+@pytest.fixture
+def upload(app, tmp_path):
+    """A CSV of ROWS valid posts and the pending job importing it."""
+    db.session.add(User(id=1, name="user", email="user@a.b"))
+    db.session.add(ImportJob(id=1, task_id="job", user_id=1))
+    db.session.commit()
+    path = tmp_path / "posts.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["title", "description", "status"])
+        for row in range(1, ROWS + 1):
+            writer.writerow([f"title {row}", "description", 1])
+    return str(path)
+
+
+def test_transient_batch_error_retries_from_checkpoint(upload):
+    ids = count(1)
+    calls = []
+
+    def bulk_insert(values):
+        calls.append(len(values))
+        if len(calls) == 2:
+            raise OperationalError(
+                "INSERT", {}, Exception("1205 Lock wait timeout exceeded")
+            )
+        # SQLite only autoincrements INTEGER (not BIGINT) primary keys
+        db.session.execute(insert(Post), [{**v, "id": next(ids)} for v in values])
+
+    with (
+        mock.patch.object(import_posts, "r", mock.MagicMock()),
+        mock.patch.object(import_posts, "CSV_IMPORT_BATCH_SIZE", 4),
+        mock.patch.object(import_posts.PostDao, "bulk_insert", bulk_insert),
+        mock.patch.object(import_posts.CountCache, "invalidate"),
+    ):
+        import_posts.import_posts_from_csv.apply(args=[upload, 1], task_id="job")
+
+    # the failed batch is retried whole, never split into per-row errors
+    assert calls == [4, 4, 4, 2]
+    assert Post.query.count() == ROWS
+    job = ImportJob.query.filter_by(task_id="job").one()
+    assert job.last_row == ROWS
+    assert job.status == ImportJobStatus.SUCCESS.value
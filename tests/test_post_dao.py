@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app.controllers.post_controller import posts_schema
+from app.dao.post_dao import PostDao
+from app.enum.user import UserRole
+from app.extension import db
+from app.models.post import Post
+from app.models.user import User
+from app.utils.jwt import AuthIdentity
+
+POSTS = 25
+PER_PAGE = 10
+
+
+@pytest.fixture
+def posts(app):
+    """POSTS posts spread over several creators / updaters, on both engines."""
+    users = [
+        {"id": i, "name": f"user{i}", "email": f"user{i}@a.b", "role": 0}
+        for i in range(1, 6)
+    ]
+    rows = [
+        {
+            "id": i,
+            "title": f"title {i}",
+            "description": "description",
+            "status": 1,
+            "create_user_id": i % 5 + 1,
+            "updated_user_id": (i + 1) % 5 + 1,
+        }
+        for i in range(1, POSTS + 1)
+    ]
+    for engine in db.engines.values():
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert(), users)
+            conn.execute(Post.__table__.insert(), rows)
+
+    with app.test_request_context():
+        g.auth_identity = AuthIdentity(
+            1, {"user": {"id": 1, "role": UserRole.ADMIN.value}}
+        )
+        yield
+
+
+@contextmanager
+def count_statements():
+    """Collect the SQL statements run on every engine inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_paginate_runs_constant_queries_per_page(posts):
+    seen = 0
+    for page in range(1, POSTS // PER_PAGE + 2):
+        with count_statements() as statements:
+            pagination = PostDao.paginate({}, page, PER_PAGE, "exact")
+            items = posts_schema.dump(pagination.items)
+        # page, creators, updaters, count
+        assert len(statements) == 4
+        assert all(item["creator"] and item["updater"] for item in items)
+        seen += len(items)
+    assert seen == POSTS
+
+
+def test_cursor_paginate_runs_constant_queries_per_page(posts):
+    seen = 0
+    cursor = None
+    while True:
+        with count_statements() as statements:
+            page = PostDao.cursor_paginate({}, cursor, PER_PAGE)
+            items = posts_schema.dump(page["items"])
+        # page, creators, updaters
+        assert len(statements) == 3
+        assert all(item["creator"] and item["updater"] for item in items)
+        seen += len(items)
+        if not page["next_cursor"]:
+            break
+        cursor = {"id": page["items"][-1].id, "dir": "next"}
+    assert seen == POSTS
@@ -0,0 +1,72 @@
+from sqlalchemy import select, update
+
+from app.dao.user_dao import UserDao
+from app.extension import db
+from app.models.user import User
+from app.shared.database import REPLICA_BIND
+
+
+def seed(bind, name):
+    """Insert a user straight into one engine, so each side is recognisable."""
+    # SQLite only autoincrements INTEGER (not BIGINT) primary keys
+    with db.engines[bind].begin() as conn:
+        conn.execute(
+            User.__table__.insert().values(id=1, name=name, email=f"{name}@a.b")
+        )
+
+
+def names():
+    return [user.name for user in User.query.order_by(User.id).all()]
+
+
+def setup_engines():
+    seed(None, "primary")
+    seed(REPLICA_BIND, "replica")
+
+
+def test_reads_use_primary_by_default(app):
+    setup_engines()
+    assert names() == ["primary"]
+
+
+def test_replica_block_reads_from_replica(app):
+    setup_engines()
+    with db.replica():
+        assert names() == ["replica"]
+
+
+def test_replica_execution_option_reads_from_replica(app):
+    setup_engines()
+    statement = select(User.name).execution_options(replica=True)
+    assert db.session.execute(statement).scalars().all() == ["replica"]
+
+
+def test_reads_after_flush_stay_on_primary(app):
+    setup_engines()
+    db.session.add(User(id=2, name="new", email="new@a.b"))
+    db.session.flush()
+    with db.replica():
+        assert names() == ["primary", "new"]
+
+
+def test_reads_after_write_stay_on_primary(app):
+    setup_engines()
+    db.session.execute(update(User).values(address="Yangon"))
+    with db.replica():
+        assert names() == ["primary"]
+    statement = select(User.name).execution_options(replica=True)
+    assert db.session.execute(statement).scalars().all() == ["primary"]
+
+
+def test_replica_engine_gets_pool_options(app):
+    pool = db.engines[REPLICA_BIND].pool
+    assert pool._pre_ping
+    assert pool._recycle == app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_recycle"]
+
+
+def test_get_user_reads_primary_unless_replica(app):
+    seed(None, "primary")
+    seed(REPLICA_BIND, "replica")
+    assert UserDao.get_user(1).name == "primary"
+    db.session.remove()
+    assert UserDao.get_user(1, replica=True).name == "replica"